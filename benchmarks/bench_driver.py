@@ -0,0 +1,48 @@
+"""
+chromedriver 경로 확인 시간 측정: 매번 chromedriver_autoinstaller.install() vs manifest 캐시(ChromeDriverResolver).
+Chrome이 설치되어 있어야 하며, 첫 install()은 드라이버 다운로드를 위해 네트워크가 필요.
+
+    python -m benchmarks.bench_driver --repeat 5
+"""
+import os, sys, time, argparse, tempfile, statistics
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return result, statistics.median(samples) * 1000
+
+
+def main():
+    import chromedriver_autoinstaller
+    from core.utils.chrome_manager import ChromeDriverResolver, ChromeProcessManager
+
+    parser = argparse.ArgumentParser(description="chromedriver resolution latency benchmark")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        resolver = ChromeDriverResolver(ChromeProcessManager.CHROME_PATHS, os.path.join(directory, "manifest.json"))
+        if resolver.find_chrome_binary() is None:
+            sys.exit("Chrome is not installed.")
+
+        driver_path, install_ms = timed(chromedriver_autoinstaller.install, args.repeat)
+        _, first_ms = timed(resolver.resolve, 1)  # manifest가 비어 있어 install() 후 기록
+        cached_path, cached_ms = timed(resolver.resolve, args.repeat)
+
+    print(f"driver           : {driver_path}")
+    print(f"install()        : {install_ms:8.2f} ms (median of {args.repeat})")
+    print(f"resolve (miss)   : {first_ms:8.2f} ms")
+    print(f"resolve (cached) : {cached_ms:8.2f} ms (median of {args.repeat})")
+    if cached_path != driver_path:
+        print(f"[WARN] cached path differs: {cached_path}")
+
+
+if __name__ == "__main__":
+    main()
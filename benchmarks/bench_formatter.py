@@ -0,0 +1,64 @@
+"""
+CustomFormatter 레코드당 포맷 비용 측정 (이전 구현 vs 현재 구현).
+
+    python -m benchmarks.bench_formatter --records 200000
+"""
+import os, sys, time, logging, argparse
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.utils.custom_logging import CustomFormatter
+
+
+class LegacyFormatter(logging.Formatter):
+    """캐시 도입 이전의 CustomFormatter (비교 기준)."""
+    def __init__(self, fmt=None, datefmt=None):
+        fmt = fmt or "%(asctime)s - %(levelname)s - %(relpath)s:%(lineno)d - %(funcName)s - %(message)s"
+        super().__init__(fmt, datefmt)
+
+    def format(self, record):
+        try:
+            record.relpath = os.path.relpath(record.pathname)
+        except ValueError:
+            record.relpath = record.pathname
+        return super().format(record)
+
+    def formatTime(self, record, datefmt=None):
+        datefmt = datefmt or '%Y-%m-%d %H:%M:%S'
+        self.converter(record.created)
+        return datetime.fromtimestamp(record.created).strftime(datefmt)
+
+
+def make_records(count):
+    pathname = os.path.abspath(__file__)
+    created = time.time()
+    records = []
+    for index in range(count):
+        record = logging.LogRecord("bench", logging.INFO, pathname, 42, "Article click completed: <%s>", (index,), None, "run")
+        record.created = created + index / 1000  # 초당 1000건
+        records.append(record)
+    return records
+
+
+def measure(formatter, records):
+    start = time.perf_counter()
+    for record in records:
+        formatter.format(record)
+    return (time.perf_counter() - start) / len(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CustomFormatter per-record cost benchmark")
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    records = make_records(args.records)
+    legacy = measure(LegacyFormatter(), records)
+    current = measure(CustomFormatter(), records)
+    print(f"legacy : {legacy * 1e6:.2f} us/record")
+    print(f"current: {current * 1e6:.2f} us/record ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
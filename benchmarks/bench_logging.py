@@ -0,0 +1,42 @@
+"""
+CustomLogging 핸들러 처리량 비교 (동기 BaseFileHandler vs AsyncFileHandler).
+
+    python -m benchmarks.bench_logging --records 200000
+"""
+import os, sys, time, argparse, tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.utils.custom_logging import CustomLogging
+
+
+def run(records, async_mode, directory):
+    logger = CustomLogging(f"bench-{'async' if async_mode else 'sync'}")
+    logger.addHandler(os.path.join(directory, f"{'async' if async_mode else 'sync'}.log"), async_mode=async_mode)
+
+    start = time.perf_counter()
+    for index in range(records):
+        logger.info("Article click completed: <%s>", index)
+    caller = time.perf_counter() - start
+    logger.close()  # 비동기 모드는 큐가 비워질 때까지 대기
+    total = time.perf_counter() - start
+    return caller, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Logging handler throughput benchmark")
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for async_mode in (False, True):
+            caller, total = run(args.records, async_mode, directory)
+            print(
+                f"{'async' if async_mode else 'sync':>5}: "
+                f"caller {args.records / caller:>10,.0f} records/s, "
+                f"end-to-end {args.records / total:>10,.0f} records/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
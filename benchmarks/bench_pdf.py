@@ -0,0 +1,65 @@
+"""
+PDFsave 최대 메모리(RSS)와 실행 시간 측정: 이전 방식(Pillow append_images) vs StreamingPDFWriter.
+각 방식은 별도 프로세스에서 실행하여 최대 RSS를 분리 측정 (Linux/macOS).
+
+    python -m benchmarks.bench_pdf --pages 50 100 200
+"""
+import os, sys, time, json, argparse, tempfile, subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.corpora import make_screenshots
+
+
+def legacy_pdfsave(image_folder, output_pdf):
+    """StreamingPDFWriter 도입 이전의 PDFsave (비교 기준)."""
+    from PIL import Image
+    from core.utils.file.save_imagefiles import load_image_files
+    images = []
+    for file in load_image_files(image_folder):
+        img = Image.open(file)
+        if img.mode != "RGB":
+            img = img.convert("RGB")
+        images.append(img)
+    images[0].save(output_pdf, save_all=True, append_images=images[1:])
+
+
+def child(mode, folder, output_pdf):
+    import resource, contextlib, io
+    from core.utils.file.save_imagefiles import PDFsave
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        (legacy_pdfsave if mode == "legacy" else PDFsave)(folder, output_pdf)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    print(json.dumps({"seconds": elapsed, "peak_rss_mb": peak_mb, "output_mb": os.path.getsize(output_pdf) / 2 ** 20}))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDFsave memory benchmark")
+    parser.add_argument("--pages", type=int, nargs="+", default=[25, 50, 100])
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(*args.child)
+
+    with tempfile.TemporaryDirectory() as directory:
+        for pages in args.pages:
+            folder = os.path.join(directory, f"shots_{pages}")
+            make_screenshots(folder, pages)
+            for mode in ("legacy", "streaming"):
+                output_pdf = os.path.join(directory, f"{mode}_{pages}.pdf")
+                result = subprocess.run(
+                    [sys.executable, "-m", "benchmarks.bench_pdf", "--child", mode, folder, output_pdf],
+                    cwd=ROOT, capture_output=True, text=True, check=True
+                )
+                stats = json.loads(result.stdout)
+                print(f"{pages:>4} pages {mode:<9}: {stats['seconds']:6.2f}s, "
+                      f"peak RSS {stats['peak_rss_mb']:7.1f} MB, output {stats['output_mb']:6.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
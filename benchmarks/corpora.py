@@ -0,0 +1,100 @@
+"""
+벤치마크용 합성 데이터 생성 (네트워크 불필요, seed 고정으로 실행마다 같은 데이터).
+"""
+import os, random
+from datetime import datetime, timedelta
+
+LOG_LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARNING", "ERROR"]
+LOG_MESSAGES = [
+    "Article click completed: <%d>",
+    "Moving to page %d",
+    "Element not found, retrying (%d)",
+    "Like button pressed for article %d",
+]
+
+
+def make_log_file(path, lines, seed=0):
+    """CustomFormatter 기본 형식의 로그 파일을 lines줄 생성하고 크기(바이트)를 반환."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1)
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        batch = []
+        for index in range(lines):
+            timestamp = (start + timedelta(milliseconds=index * 250)).strftime("%Y-%m-%d %H:%M:%S")
+            level = rng.choice(LOG_LEVELS)
+            message = rng.choice(LOG_MESSAGES) % index
+            batch.append(f"{timestamp} - {level} - core/everytime/autolike.py:{rng.randint(10, 200)} - start - {message}\n")
+            if len(batch) == 10_000:
+                f.writelines(batch)
+                batch.clear()
+        f.writelines(batch)
+    return os.path.getsize(path)
+
+
+def make_large_files(directory, files, size_mb):
+    """size_mb 크기의 서로 다른 파일을 files개 생성하고 경로 목록을 반환 (해시 처리량 측정용)."""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    block = os.urandom(1024 * 1024)
+    for index in range(files):
+        path = os.path.join(directory, f"video_{index}.mp4")
+        with open(path, "wb") as f:
+            for _ in range(size_mb):
+                f.write(block)
+            f.write(index.to_bytes(4, "little"))
+        paths.append(path)
+    return paths
+
+
+def make_duplicate_tree(root, files, duplicate_ratio=0.3, size_kb=(4, 256), depth=3, seed=0):
+    """
+    하위 폴더에 걸쳐 files개의 파일을 만들고 그중 duplicate_ratio 비율을 다른 파일의 복사본으로 생성.
+    - 같은 크기·같은 앞부분을 가진 서로 다른 파일도 섞어 부분 해시 단계를 거치도록 함
+    - 반환: 생성한 중복 파일 수
+    """
+    rng = random.Random(seed)
+    folders = [root]
+    for level in range(depth):
+        for index in range(3):
+            folders.append(os.path.join(folders[level], f"dir_{level}_{index}"))
+    for folder in folders:
+        os.makedirs(folder, exist_ok=True)
+
+    originals, duplicates = [], 0
+    for index in range(files):
+        folder = rng.choice(folders)
+        extension = rng.choice([".jpg", ".png", ".mp4"])
+        path = os.path.join(folder, f"file_{index}{extension}")
+        if originals and rng.random() < duplicate_ratio:
+            with open(rng.choice(originals), "rb") as source:
+                data = source.read()
+            duplicates += 1
+        elif originals and rng.random() < 0.1:
+            # 크기와 앞부분이 같고 끝만 다른 파일 (부분 해시는 같지만 전체 해시는 다름)
+            with open(rng.choice(originals), "rb") as source:
+                data = bytearray(source.read())
+            data[-1] ^= 0xFF
+        else:
+            data = rng.randbytes(rng.randint(*size_kb) * 1024)
+        with open(path, "wb") as f:
+            f.write(data)
+        originals.append(path)
+    return duplicates
+
+
+def make_screenshots(folder, pages, size=(1920, 1080)):
+    """screenshot_N.png / screenshot_N.jpg 형태의 합성 스크린샷 생성."""
+    from PIL import Image, ImageDraw
+    os.makedirs(folder, exist_ok=True)
+    random.seed(0)
+    for index in range(pages):
+        img = Image.new("RGB", size, (240, 240, 240))
+        draw = ImageDraw.Draw(img)
+        for _ in range(40):
+            x, y = random.randint(0, size[0] - 200), random.randint(0, size[1] - 50)
+            draw.rectangle([x, y, x + random.randint(20, 200), y + random.randint(10, 50)],
+                           fill=tuple(random.randint(0, 255) for _ in range(3)))
+        if index % 2:
+            img.save(os.path.join(folder, f"screenshot_{index}.jpg"), quality=85)
+        else:
+            img.save(os.path.join(folder, f"screenshot_{index}.png"))
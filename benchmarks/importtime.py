@@ -0,0 +1,81 @@
+"""
+하위 명령별 시작(import) 시간 측정: python -X importtime으로 새 프로세스에서 명령의 실행 함수를 import.
+"--help"는 main.py만 import하는 기준값 (하위 명령 모듈을 불러오지 않음).
+
+    python -m benchmarks.importtime
+    python -m benchmarks.importtime pdf ppt --repeat 5 --top 10 --json importtime.json
+"""
+import os, re, sys, json, time, argparse, statistics, subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def parse_importtime(stderr):
+    """-X importtime 출력에서 [(모듈, self us, cumulative us, 깊이)]를 반환."""
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            modules.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+    return modules
+
+
+def measure(command):
+    """새 프로세스에서 command의 import 시간 측정 (캐시된 .pyc 사용, 첫 실행은 제외 권장)."""
+    if command == "--help":
+        code = "import main"
+    else:
+        code = f"import main; main.load_command({command!r})"
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+    modules = parse_importtime(result.stderr)
+    top_level = [module for module in modules if module[3] == 0]
+    return {
+        "wall_ms": wall * 1000,
+        "import_ms": sum(module[2] for module in top_level) / 1000,
+        "modules": len(modules),
+        "top": sorted(top_level, key=lambda module: module[2], reverse=True),
+    }
+
+
+def main():
+    import main as cli
+    parser = argparse.ArgumentParser(description="Sub-command cold-start (import time) benchmark")
+    parser.add_argument("commands", nargs="*", default=["--help"] + list(cli.COMMANDS))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per command (median is reported)")
+    parser.add_argument("--top", type=int, default=5, help="Show the N slowest top-level imports")
+    parser.add_argument("--json", help="Write results to a JSON file")
+    args = parser.parse_args()
+
+    results = {}
+    for command in args.commands:
+        measure(command)  # 첫 실행은 .pyc 생성/디스크 캐시 영향이 있으므로 제외
+        runs = [measure(command) for _ in range(args.repeat)]
+        median = lambda key: statistics.median(run[key] for run in runs)
+        results[command] = {
+            "wall_ms": median("wall_ms"),
+            "import_ms": median("import_ms"),
+            "modules": runs[-1]["modules"],
+            "top": [{"module": module, "cumulative_ms": cumulative / 1000} for module, _, cumulative, _ in runs[-1]["top"][:args.top]],
+        }
+        print(f"{command:<10}: wall {results[command]['wall_ms']:7.1f} ms, "
+              f"imports {results[command]['import_ms']:7.1f} ms, {results[command]['modules']:4d} modules")
+        for entry in results[command]["top"]:
+            print(f"{'':12}{entry['cumulative_ms']:7.1f} ms  {entry['module']}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,370 @@
+"""
+core/utils 주요 경로 벤치마크 모음: 실행 시간과 최대 메모리(RSS)를 측정하여 JSON으로 저장하고 커밋 간 비교.
+각 항목은 별도 프로세스에서 실행하여 최대 RSS를 분리 측정 (Linux/macOS, 자식 프로세스 포함).
+합성 데이터는 실행 시 임시 폴더에 생성하므로 네트워크 없이 실행 가능.
+
+    python -m benchmarks.suite                              # 전체 실행 (small)
+    python -m benchmarks.suite read_logs_tail dedup --repeat 5   # 일부 항목만
+    python -m benchmarks.suite --scale medium --json results/$(git rev-parse --short HEAD).json
+    python -m benchmarks.suite --compare results/base.json results/new.json
+"""
+import os, io, sys, json, time, shutil, argparse, platform, tempfile, statistics, subprocess, contextlib
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks import corpora
+
+# 규모별 데이터 크기
+SCALES = {
+    "small": {"log_lines": 200_000, "records": 100_000, "hash_files": 4, "hash_mb": 16,
+              "tree_files": 2_000, "pages": 20, "json_records": 5_000},
+    "medium": {"log_lines": 1_000_000, "records": 500_000, "hash_files": 8, "hash_mb": 64,
+               "tree_files": 10_000, "pages": 60, "json_records": 20_000},
+}
+
+
+# 각 항목: 함수(데이터 폴더, 작업 폴더, 규모 설정) -> (처리량 단위 수, 단위[, 직접 잰 시간])
+# 데이터 폴더는 읽기 전용, 출력·캐시는 실행마다 새로 만드는 작업 폴더에 기록
+# 준비 작업(캐시 예열 등)은 setup으로 분리하여 같은 작업 폴더로 별도 프로세스에서 먼저 실행
+# (ru_maxrss는 최대값이므로 같은 프로세스에서 실행하면 준비 작업의 메모리가 측정값에 섞임)
+
+def read_logs_tail(corpus_dir, workdir, scale):
+    from core.utils.custom_logging import read_logs
+    read_logs(os.path.join(corpus_dir, "app.log"), num_lines=1000)
+    return 1000, "lines"
+
+
+def read_logs_full(corpus_dir, workdir, scale):
+    from core.utils.custom_logging import read_logs
+    read_logs(os.path.join(corpus_dir, "app.log"))
+    return scale["log_lines"], "lines"
+
+
+def search_logs_all(corpus_dir, workdir, scale):
+    from core.utils.custom_logging import search_logs
+    for _ in search_logs(os.path.join(corpus_dir, "app.log"), r"ERROR - .* - (Article click completed: <\d+>)"):
+        pass
+    return scale["log_lines"], "lines"
+
+
+def formatter(corpus_dir, workdir, scale):
+    from benchmarks.bench_formatter import make_records
+    from core.utils.custom_logging import CustomFormatter
+    records = make_records(scale["records"])
+    custom_formatter = CustomFormatter()
+    start = time.perf_counter()
+    for record in records:
+        custom_formatter.format(record)
+    return scale["records"], "records", time.perf_counter() - start  # 레코드 생성 시간 제외
+
+
+def _handler(workdir, scale, async_mode):
+    from benchmarks.bench_logging import run
+    _, total = run(scale["records"], async_mode, workdir)
+    return scale["records"], "records", total
+
+
+def handler_sync(corpus_dir, workdir, scale):
+    return _handler(workdir, scale, False)
+
+
+def handler_async(corpus_dir, workdir, scale):
+    return _handler(workdir, scale, True)
+
+
+def _hash_paths(corpus_dir):
+    folder = os.path.join(corpus_dir, "hash")
+    return [os.path.join(folder, name) for name in sorted(os.listdir(folder))]
+
+
+def hash_warmup(corpus_dir, workdir, scale):
+    from core.utils.file.hashing import hash_file
+    for path in _hash_paths(corpus_dir):  # 페이지 캐시 예열 (디스크가 아닌 해시 처리량 측정)
+        hash_file(path)
+
+
+def hash_file_md5(corpus_dir, workdir, scale):
+    from core.utils.file.delete_file import calculate_file_hash
+    for path in _hash_paths(corpus_dir):
+        calculate_file_hash(path)
+    return scale["hash_files"] * scale["hash_mb"], "MB"
+
+
+def _dedup(corpus_dir, workdir, use_cache):
+    # dry_run: 파일은 변경하지 않고 보고서(작업 폴더)만 작성
+    from core.utils.file.delete_file import remove_duplicate_files
+    report_path = os.path.join(workdir, "duplicate_report.csv")
+    remove_duplicate_files(os.path.join(corpus_dir, "tree"), dry_run=True, use_cache=use_cache,
+                           cache_path=os.path.join(workdir, "hash_cache.sqlite3"), report_path=report_path)
+
+
+def dedup(corpus_dir, workdir, scale):
+    _dedup(corpus_dir, workdir, use_cache=False)
+    return scale["tree_files"], "files"
+
+
+def dedup_cache_warmup(corpus_dir, workdir, scale):
+    _dedup(corpus_dir, workdir, use_cache=True)
+
+
+def dedup_cached(corpus_dir, workdir, scale):
+    _dedup(corpus_dir, workdir, use_cache=True)
+    return scale["tree_files"], "files"
+
+
+def pdfsave(corpus_dir, workdir, scale):
+    from core.utils.file.save_imagefiles import PDFsave
+    PDFsave(os.path.join(corpus_dir, "screenshots"), os.path.join(workdir, "output.pdf"))
+    return scale["pages"], "pages"
+
+
+def pptsave(corpus_dir, workdir, scale):
+    # 축소 이미지 캐시를 작업 폴더에 두어 매번 축소부터 측정
+    from core.utils.file.save_imagefiles import PPTsave
+    PPTsave(os.path.join(corpus_dir, "screenshots"), os.path.join(workdir, "output.pptx"),
+            cache_dir=os.path.join(workdir, "prescale_cache"))
+    return scale["pages"], "pages"
+
+
+def append_json(corpus_dir, workdir, scale):
+    from core.utils.file import json_file
+    os.chdir(workdir)  # json_file은 config/Location_Info.jsonl(상대 경로)에 기록
+    for index in range(scale["json_records"]):
+        json_file.append_json({"id": index, "name": f"location_{index}", "coords": [37.5 + index / 1e5, 127.0]})
+    return scale["json_records"], "records"
+
+
+# 이름 -> (측정 함수, 준비 함수, 필요한 데이터)
+CASES = {
+    "read_logs_tail": (read_logs_tail, None, "log"),
+    "read_logs_full": (read_logs_full, None, "log"),
+    "search_logs": (search_logs_all, None, "log"),
+    "formatter": (formatter, None, None),
+    "handler_sync": (handler_sync, None, None),
+    "handler_async": (handler_async, None, None),
+    "hash_file": (hash_file_md5, hash_warmup, "hash"),
+    "dedup": (dedup, None, "tree"),
+    "dedup_cached": (dedup_cached, dedup_cache_warmup, "tree"),
+    "pdfsave": (pdfsave, None, "screenshots"),
+    "pptsave": (pptsave, None, "screenshots"),
+    "append_json": (append_json, None, None),
+}
+
+
+def corpus_params(name, scale):
+    """데이터 종류별 생성 매개변수 (재사용 시 이 값이 같은지 확인)."""
+    if name == "log":
+        return {"log_lines": scale["log_lines"]}
+    if name == "hash":
+        return {"hash_files": scale["hash_files"], "hash_mb": scale["hash_mb"]}
+    if name == "tree":
+        return {"tree_files": scale["tree_files"]}
+    if name == "screenshots":
+        return {"pages": scale["pages"], "size": [1280, 720]}
+    raise ValueError(f"Unknown corpus '{name}'")
+
+
+def make_corpus(name, corpus_dir, scale_name):
+    """
+    필요한 데이터를 corpus_dir에 생성하고 <이름>.meta.json에 규모와 매개변수를 기록.
+    - 이미 있는 데이터는 meta가 같을 때만 재사용하고, 다르면(다른 --scale로 생성 등) 삭제 후 다시 생성
+    - Linux의 ru_maxrss는 fork/exec 후에도 부모의 값을 이어받으므로, 측정 프로세스를 실행하는
+      부모의 메모리가 커지지 않도록 별도 프로세스에서 호출 (--make-corpus)
+    """
+    scale = SCALES[scale_name]
+    meta = {"scale": scale_name, "params": corpus_params(name, scale)}
+    path = os.path.join(corpus_dir, "app.log" if name == "log" else name)
+    meta_path = os.path.join(corpus_dir, f"{name}.meta.json")
+    if os.path.exists(path):
+        try:
+            with open(meta_path, "r", encoding="utf-8") as f:
+                if json.load(f) == meta:
+                    return
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+        print(f"[corpus] {name:<12} does not match --scale {scale_name}; regenerating", file=sys.stderr)
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        else:
+            os.remove(path)
+
+    start = time.perf_counter()
+    if name == "log":
+        corpora.make_log_file(path, meta["params"]["log_lines"])
+    elif name == "hash":
+        corpora.make_large_files(path, meta["params"]["hash_files"], meta["params"]["hash_mb"])
+    elif name == "tree":
+        corpora.make_duplicate_tree(path, meta["params"]["tree_files"])
+    elif name == "screenshots":
+        corpora.make_screenshots(path, meta["params"]["pages"], tuple(meta["params"]["size"]))
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    print(f"[corpus] {name:<12} {time.perf_counter() - start:6.1f}s", file=sys.stderr)
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        return None  # Windows
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024  # macOS는 바이트, Linux는 KB
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss  # 프로세스 풀 작업
+    return max(own, children) / divisor
+
+
+def child_setup(name, corpus_dir, workdir, scale_name):
+    """항목의 준비 작업만 실행 (측정 프로세스와 분리된 별도 프로세스에서 호출)."""
+    setup = CASES[name][1]
+    with contextlib.redirect_stdout(io.StringIO()):
+        setup(corpus_dir, workdir, SCALES[scale_name])
+
+
+def child(name, corpus_dir, workdir, scale_name):
+    """항목 하나를 실행하고 결과를 JSON 한 줄로 출력 (별도 프로세스에서 호출)."""
+    run = CASES[name][0]
+    scale = SCALES[scale_name]
+    with contextlib.redirect_stdout(io.StringIO()):  # 측정 대상의 출력은 버림
+        baseline_rss = _peak_rss_mb()
+        start = time.perf_counter()
+        result = run(corpus_dir, workdir, scale)
+        elapsed = time.perf_counter() - start
+    units, unit = result[:2]
+    if len(result) == 3:
+        elapsed = result[2]  # 측정 함수가 직접 잰 구간
+    print(json.dumps({"seconds": elapsed, "units": units, "unit": unit,
+                      "peak_rss_mb": _peak_rss_mb(), "baseline_rss_mb": baseline_rss}))
+
+
+def run_case(name, corpus_dir, scale_name, repeat):
+    runs = []
+    for _ in range(repeat):
+        # 실행마다 새 작업 폴더 (출력 파일, 캐시가 다음 실행에 영향을 주지 않도록)
+        with tempfile.TemporaryDirectory() as workdir:
+            arguments = [name, corpus_dir, workdir, scale_name]
+            if CASES[name][1]:
+                setup = subprocess.run([sys.executable, "-m", "benchmarks.suite", "--setup", *arguments],
+                                       cwd=ROOT, capture_output=True, text=True)
+                if setup.returncode != 0:
+                    raise RuntimeError(f"{name} setup failed:\n{setup.stderr}")
+            output = subprocess.run(
+                [sys.executable, "-m", "benchmarks.suite", "--child", *arguments],
+                cwd=ROOT, capture_output=True, text=True
+            )
+        if output.returncode != 0:
+            raise RuntimeError(f"{name} failed:\n{output.stderr}")
+        runs.append(json.loads(output.stdout.strip().splitlines()[-1]))
+
+    seconds = statistics.median(run["seconds"] for run in runs)
+    peaks = [run["peak_rss_mb"] for run in runs if run["peak_rss_mb"] is not None]
+    baselines = [run["baseline_rss_mb"] for run in runs if run["baseline_rss_mb"] is not None]
+    return {
+        "seconds": seconds,
+        "seconds_min": min(run["seconds"] for run in runs),
+        "throughput": runs[0]["units"] / seconds if seconds else None,
+        "unit": f"{runs[0]['unit']}/s",
+        "peak_rss_mb": max(peaks) if peaks else None,
+        "baseline_rss_mb": min(baselines) if baselines else None,
+        "repeat": repeat,
+    }
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def metadata(scale_name):
+    return {
+        "commit": _git("rev-parse", "HEAD"),
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale_name,
+    }
+
+
+def _format_mb(value):
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def print_results(results):
+    print(f"{'case':<16}{'seconds':>10}{'throughput':>16}  {'unit':<12}{'peak MB':>8}{'base MB':>9}")
+    for name, result in results.items():
+        print(f"{name:<16}{result['seconds']:10.3f}{result['throughput']:16,.0f}  {result['unit']:<12}"
+              f"{_format_mb(result['peak_rss_mb'])} {_format_mb(result['baseline_rss_mb'])}")
+
+
+def compare(base_path, new_path):
+    """두 결과 JSON의 항목별 시간/최대 RSS 변화율을 출력."""
+    with open(base_path, "r", encoding="utf-8") as f:
+        base = json.load(f)
+    with open(new_path, "r", encoding="utf-8") as f:
+        new = json.load(f)
+    describe = lambda meta: f"{(meta.get('commit') or '?')[:10]}{'+dirty' if meta.get('dirty') else ''} ({meta.get('scale')})"
+    print(f"base: {describe(base['meta'])}  new: {describe(new['meta'])}")
+    print(f"{'case':<16}{'base s':>10}{'new s':>10}{'time':>9}{'base MB':>10}{'new MB':>9}{'RSS':>9}")
+    change = lambda old, value: f"{(value - old) / old * 100:+8.1f}%" if old and value is not None else f"{'-':>9}"
+    for name in [name for name in base["results"] if name in new["results"]]:
+        old_result, new_result = base["results"][name], new["results"][name]
+        print(f"{name:<16}{old_result['seconds']:10.3f}{new_result['seconds']:10.3f}"
+              f"{change(old_result['seconds'], new_result['seconds'])}"
+              f"{_format_mb(old_result['peak_rss_mb'])}  {_format_mb(new_result['peak_rss_mb'])}"
+              f"{change(old_result['peak_rss_mb'], new_result['peak_rss_mb'])}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="core/utils benchmark suite")
+    parser.add_argument("cases", nargs="*", metavar="case", help=f"Cases to run (default: all): {', '.join(CASES)}")
+    parser.add_argument("--scale", choices=list(SCALES), default="small")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case (median time, max RSS)")
+    parser.add_argument("--json", help="Write results to a JSON file")
+    parser.add_argument("--corpus-dir", help="Reuse generated data in this folder (default: temporary)")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="Compare two result JSON files")
+    parser.add_argument("--child", nargs=4, help=argparse.SUPPRESS)
+    parser.add_argument("--setup", nargs=4, help=argparse.SUPPRESS)
+    parser.add_argument("--make-corpus", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        return child(*args.child)
+    if args.setup:
+        return child_setup(*args.setup)
+    if args.make_corpus:
+        return make_corpus(*args.make_corpus)
+    if args.compare:
+        return compare(*args.compare)
+
+    cases = args.cases or list(CASES)
+    unknown = [name for name in cases if name not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}. Choose from {', '.join(CASES)}")
+    with contextlib.ExitStack() as stack:
+        corpus_dir = os.path.abspath(args.corpus_dir or stack.enter_context(tempfile.TemporaryDirectory()))
+        os.makedirs(corpus_dir, exist_ok=True)
+        for corpus in sorted({CASES[name][2] for name in cases} - {None}):
+            subprocess.run(
+                [sys.executable, "-m", "benchmarks.suite", "--make-corpus", corpus, corpus_dir, args.scale],
+                cwd=ROOT, check=True
+            )
+
+        results = {}
+        for name in cases:
+            results[name] = run_case(name, corpus_dir, args.scale, args.repeat)
+            print(f"[case] {name:<16} {results[name]['seconds']:8.3f}s", file=sys.stderr)
+
+    print_results(results)
+    if args.json:
+        directory = os.path.dirname(args.json)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"meta": metadata(args.scale), "results": results}, f, indent=4)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,21 @@
-from core.everytime.everytime_auto import RunEverytimeAutoLike
+import importlib
+
+# 공개 이름 -> 정의된 모듈 (처음 접근할 때 import, PEP 562)
+_LAZY_ATTRIBUTES = {
+    "RunEverytimeAutoLike": "core.everytime.everytime_auto",
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # 이후 접근은 모듈 속성으로 바로 조회
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,4 +1,3 @@
-import re
 import time
 import random
 from typing import Optional, List
@@ -8,7 +7,8 @@ from core.everytime.everytime_utils import _navigate
 from core.everytime.everytime_utils import _scroll_into_view
 from core.everytime.everytime_utils import _initialize_articles
 from core.everytime.exception import exception_handler
-from core.utils.custom_logging import read_logs
+from core.utils.metrics import instrument
+from core.utils.custom_logging import search_logs
 from core.utils.custom_logging import CustomLogging
 
 
@@ -24,26 +24,23 @@ def _find_first_article(
     logger.info("Reading logs to find the starting article...")
 
     try:
-        strLogs: str = read_logs(filename, encoding, num_lines)
-        if not strLogs:
-            logger.error("Log file is empty or missing.")
-            return None
-        
-        found_count = 0
         start_article = []
 
-        for row in reversed(strLogs.splitlines()):
-            match = re.search(pattern, row)
-            if match:
-                start_article_text = match.group(1)
-                logger.info("Found the starting point for likes in logs: %s", start_article_text)
-                start_article.append(start_article_text)
-                found_count += 1
-                if found_count >= 5:
-                    return start_article
+        # 최신 로그부터 역방향으로 탐색하며 5개를 찾으면 즉시 중단
+        for match in search_logs(filename, pattern, limit=5, encoding=encoding, num_lines=num_lines):
+            start_article_text = match.group(1)
+            logger.info("Found the starting point for likes in logs: %s", start_article_text)
+            start_article.append(start_article_text)
+
+        if len(start_article) >= 5:
+            return start_article
         logger.warning("No matching articles found in logs.")
         return None
     
+    except FileNotFoundError:
+        logger.error("Log file is empty or missing.")
+        return None
+
     except Exception as e:
         logger.error("Error while finding the first article: %s", e)
         return None
@@ -91,6 +88,7 @@ def _find_article_for_click(
         return None, default_forward_pages
 
 @exception_handler
+@instrument
 def move_to_board(
     browser: Chrome, 
     logger: CustomLogging, 
@@ -118,6 +116,7 @@ def move_to_board(
     logger.warning("Board '%s' not found!", board_name)
 
 @exception_handler
+@instrument
 def find_starting_point(
     browser: Chrome, 
     logger: CustomLogging,
@@ -8,6 +8,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from core.everytime.exception import exception_handler
+from core.utils.metrics import instrument
 from core.everytime.everytime_utils import _navigate
 from core.everytime.everytime_utils import _scroll_into_view
 from core.everytime.everytime_utils import _initialize_articles
@@ -22,6 +23,7 @@ class EverytimeAutoLiker:
     
     @classmethod
     @exception_handler
+    @instrument
     def start(cls, browser, logger, start_article, page_num):
         liker = cls(browser, logger, start_article, page_num)
         liker.run()
@@ -4,7 +4,7 @@ from core.everytime.autolike import EverytimeAutoLiker
 from core.everytime.login import login_everytime
 from core.utils.custom_logging import GetLogger
 from core.utils.file.env_utils import load_env
-from core.utils.chrome_manager import ChromeDriverService
+from core.utils.chrome_manager import ChromeDriverService, ChromeStartupError
 
 class RunEverytimeAutoLike(ChromeDriverService):
     def __init__(self, headless, logging_file_path="app.log"):
@@ -48,11 +48,15 @@ class RunEverytimeAutoLike(ChromeDriverService):
 
             EverytimeAutoLiker.start(self.browser, self.logger, start_article, page_num)
 
+        except ChromeStartupError as e:
+            self.logger.error("Chrome failed to start: %s", e)
+            raise
+
         except NoSuchElementException:
+            # 처리할 게시글이 더 없으면 정상 종료
             self.logger.error("Exiting program as there are no more elements to process.")
-            raise 
 
         finally:
+            # finally에서 return하면 예외(ChromeStartupError 등)가 사라지므로 정리만 수행
             self.stop()
             self.logger.info("The task is complete.")
-            return 
\ No newline at end of file
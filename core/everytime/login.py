@@ -6,9 +6,11 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import NoSuchElementException
 from core.everytime.exception import exception_handler
+from core.utils.metrics import instrument
 from core.utils.custom_logging import CustomLogging
 
 @exception_handler
+@instrument
 def login_everytime(
     browser: Chrome, 
     logger: CustomLogging,
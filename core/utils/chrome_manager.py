@@ -1,10 +1,14 @@
-import re
+import json
+import shutil
+import urllib.request, urllib.error
 from typing import Optional
 import subprocess
 import chromedriver_autoinstaller
 from selenium_stealth import stealth
-import os, socket, shlex, platform, traceback
+import os, time, signal, socket, shlex, platform, tempfile, traceback
 from selenium.webdriver import Chrome, ChromeOptions
+from selenium.webdriver.chrome.service import Service
+from core.utils.metrics import instrument
 
 def find_available_port() -> int:
     with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
@@ -15,6 +19,166 @@ def find_chrome_path(CHROME_PATHS) -> Optional[str]:
     """CHROME_PATHS 중 존재하는 실행 파일 경로를 반환"""
     return next((path for path in CHROME_PATHS if os.path.exists(path)), None)
 
+# CHROME_PATHS에 없을 때 PATH에서 찾을 실행 파일 이름 (Linux/macOS)
+CHROME_NAMES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome"]
+
+def find_chrome_binary(CHROME_PATHS) -> Optional[str]:
+    """CHROME_PATHS 또는 PATH에서 Chrome 실행 파일을 찾아 실제 경로(심볼릭 링크 해석)를 반환"""
+    chrome_path = find_chrome_path(CHROME_PATHS)
+    if chrome_path is None:
+        chrome_path = next(filter(None, map(shutil.which, CHROME_NAMES)), None)
+    return os.path.realpath(chrome_path) if chrome_path else None
+
+class ChromeStartupError(RuntimeError):
+    """Chrome 실행 또는 DevTools 연결 준비 실패."""
+
+class ChromeNotFoundError(ChromeStartupError):
+    """Chrome 실행 파일을 찾을 수 없음."""
+
+class ChromeExitedError(ChromeStartupError):
+    """DevTools가 준비되기 전에 Chrome 프로세스가 종료됨."""
+    def __init__(self, returncode):
+        super().__init__(f"Chrome exited with code {returncode} before DevTools became ready.")
+        self.returncode = returncode
+
+class DevToolsTimeoutError(ChromeStartupError):
+    """제한 시간 안에 DevTools 엔드포인트가 응답하지 않음."""
+
+# 로컬 DevTools 확인은 http_proxy 등 프록시 환경 변수를 무시하고 직접 연결
+_LOCAL_OPENER = urllib.request.build_opener(urllib.request.ProxyHandler({}))
+
+@instrument(name="chrome.devtools_ready")
+def wait_for_devtools(port: int, timeout: float = 15.0, process: Optional[subprocess.Popen] = None,
+                      initial_delay: float = 0.02, max_delay: float = 0.5) -> dict:
+    """
+    http://127.0.0.1:<port>/json/version이 응답할 때까지 지수 백오프로 확인하고 응답(JSON)을 반환.
+    - timeout: 전체 제한 시간 (초과 시 DevToolsTimeoutError)
+    - process: Chrome Popen (지정 시 오류 코드로 종료되면 바로 ChromeExitedError)
+    """
+    url = f"http://127.0.0.1:{port}/json/version"
+    deadline = time.monotonic() + timeout
+    delay = initial_delay
+    last_error = None
+    while True:
+        if process is not None and process.poll() not in (None, 0):
+            # 종료 코드 0은 기존 Chrome에 작업을 넘기고 끝난 실행 파일일 수 있으므로 계속 확인
+            raise ChromeExitedError(process.returncode)
+        remaining = deadline - time.monotonic()
+        try:
+            with _LOCAL_OPENER.open(url, timeout=max(0.05, min(1.0, remaining))) as response:
+                return json.load(response)
+        except (urllib.error.URLError, OSError, ValueError) as e:
+            last_error = e
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DevToolsTimeoutError(f"DevTools on port {port} not ready after {timeout:.1f}s: {last_error}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
+
+def _listening_inodes_linux(port: int) -> set:
+    """/proc/net/tcp(6)에서 port로 LISTEN(0A) 중인 소켓의 inode 목록을 반환."""
+    inodes = set()
+    for table in ("/proc/net/tcp", "/proc/net/tcp6"):
+        try:
+            with open(table, "r") as f:
+                next(f)  # 헤더
+                for line in f:
+                    fields = line.split()
+                    # local_address = "주소(hex):포트(hex)", st = 상태, 9번째 열 = inode
+                    if fields[3] == "0A" and int(fields[1].rsplit(":", 1)[1], 16) == port:
+                        inodes.add(fields[9])
+        except (FileNotFoundError, StopIteration):
+            continue
+    return inodes
+
+def _find_pid_by_port_linux(port: int) -> Optional[int]:
+    inodes = _listening_inodes_linux(port)
+    if not inodes:
+        return None
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    # 각 프로세스의 열린 파일(fd) 중 해당 소켓을 가진 프로세스 찾기
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        fd_dir = f"/proc/{pid}/fd"
+        try:
+            for fd in os.listdir(fd_dir):
+                if os.readlink(f"{fd_dir}/{fd}") in targets:
+                    return int(pid)
+        except OSError:
+            continue  # 종료되었거나 권한이 없는 프로세스
+    return None
+
+def _find_pid_by_port_windows(port: int) -> Optional[int]:
+    # shell 파이프라인(findstr) 없이 netstat 출력을 직접 파싱
+    result = subprocess.run(["netstat", "-aon", "-p", "TCP"], capture_output=True, text=True, encoding="cp949")
+    for line in result.stdout.splitlines():
+        fields = line.split()
+        # "TCP  127.0.0.1:9222  0.0.0.0:0  LISTENING  1234"
+        if len(fields) == 5 and fields[3] == "LISTENING" and fields[1].rsplit(":", 1)[-1] == str(port):
+            return int(fields[4])
+    return None
+
+def find_pid_by_port(port: int) -> Optional[int]:
+    """port에서 LISTEN 중인 프로세스의 PID를 반환 (Linux: /proc, Windows: netstat, 그 외: None)."""
+    system = platform.system()
+    if system == "Linux":
+        return _find_pid_by_port_linux(port)
+    if system == "Windows":
+        return _find_pid_by_port_windows(port)
+    return None
+
+def _process_group_alive_linux(pgid: int) -> bool:
+    # 좀비(Z)는 이미 종료된 프로세스이므로 제외 (부모가 회수하기 전까지 그룹에 남아 있음)
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/stat", "r") as f:
+                fields = f.read().rsplit(")", 1)[1].split()  # 프로세스 이름에 공백/괄호가 있을 수 있음
+        except OSError:
+            continue
+        if int(fields[2]) == pgid and fields[0] != "Z":
+            return True
+    return False
+
+def _process_group_alive(pgid: int) -> bool:
+    if platform.system() == "Linux":
+        return _process_group_alive_linux(pgid)
+    try:
+        os.killpg(pgid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def terminate_process_group(pgid: int, timeout: float = 5.0, process: Optional[subprocess.Popen] = None) -> bool:
+    """
+    프로세스 그룹 전체에 SIGTERM을 보내고, timeout초 안에 종료되지 않으면 SIGKILL (POSIX 전용).
+    - process: 그룹 리더 Popen (지정 시 종료 후 wait()로 회수하여 좀비가 남지 않도록 함)
+    - 반환: 그룹의 모든 프로세스가 종료되었는지 여부
+    """
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(pgid, sig)
+        except ProcessLookupError:
+            break
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if process is not None:
+                process.poll()  # 리더가 종료되면 회수 (회수하지 않으면 좀비로 그룹에 남음)
+            if not _process_group_alive(pgid):
+                break
+            time.sleep(0.05)
+        else:
+            if sig == signal.SIGTERM:
+                print(f"[Debug] Process group {pgid} did not exit after SIGTERM. Sending SIGKILL.")
+            continue
+        break
+    if process is not None:
+        try:
+            process.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            pass
+    return not _process_group_alive(pgid)
+
 def get_user_agent():
     system = platform.system()
     if system == "Windows":
@@ -25,6 +189,140 @@ def get_user_agent():
         return "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36"
     return "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36"
 
+def _pid_alive(pid: int) -> bool:
+    """POSIX에서 pid 프로세스가 존재하는지 확인 (권한이 없어도 존재하면 True)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+class ChromeProfileManager:
+    """
+    Chrome 사용자 데이터 폴더(--user-data-dir) 관리.
+    - ephemeral: 실행마다 새 임시 폴더를 만들고(Linux는 tmpfs인 /dev/shm) 종료 시 삭제
+      (기본: Linux에서만 사용, 그 외 OS는 공유 폴더 사용)
+    - template_dir: 지정 시 임시 폴더를 이 템플릿(미리 준비한 작은 프로필)으로 채움
+    - 디스크/미디어 캐시 크기를 플래그로 제한하여 프로필이 커지지 않도록 함
+    """
+    # 템플릿 복사/저장 시 제외할 캐시·잠금 파일
+    CACHE_NAMES = {"Cache", "Code Cache", "GPUCache", "GrShaderCache", "ShaderCache", "GraphiteDawnCache",
+                   "DawnCache", "CacheStorage", "Crashpad", "component_crx_cache", "optimization_guide_model_store"}
+    LOCK_PREFIX = "Singleton"
+    PROFILE_PREFIX = "chrome-profile-"  # 임시 프로필 폴더 이름: chrome-profile-<PID>-<임의 문자열>
+    MIN_TMPFS_FREE = 128 * 1024 * 1024  # /dev/shm 여유 공간이 이보다 작으면 일반 임시 폴더 사용
+
+    def __init__(self, ephemeral: Optional[bool] = None, template_dir: Optional[str] = None,
+                 base_dir: Optional[str] = None, shared_dir: Optional[str] = None,
+                 disk_cache_size: int = 32 * 1024 * 1024, media_cache_size: int = 16 * 1024 * 1024):
+        """
+        - base_dir: 임시 프로필을 만들 폴더 (기본: Linux는 /dev/shm, 그 외 시스템 임시 폴더)
+        - shared_dir: ephemeral이 아닐 때 사용할 공유 프로필 폴더
+        """
+        self.ephemeral = platform.system() == "Linux" if ephemeral is None else ephemeral
+        self.template_dir = template_dir
+        self.base_dir = base_dir
+        self.shared_dir = shared_dir or self.default_shared_dir()
+        self.disk_cache_size = disk_cache_size
+        self.media_cache_size = media_cache_size
+        self.path: Optional[str] = None
+
+    @staticmethod
+    def default_shared_dir() -> str:
+        if platform.system() == "Windows":
+            return "C:\\chrometemp"
+        return os.path.join(default_cache_dir(), "chrome-profile")
+
+    def _default_base_dir(self) -> Optional[str]:
+        shm = "/dev/shm"
+        if platform.system() == "Linux" and os.path.isdir(shm) and os.access(shm, os.W_OK):
+            if shutil.disk_usage(shm).free >= self.MIN_TMPFS_FREE:
+                return shm
+        return None  # tempfile 기본 임시 폴더
+
+    @classmethod
+    def _ignore(cls, directory, names):
+        return [name for name in names if name in cls.CACHE_NAMES or name.startswith(cls.LOCK_PREFIX)]
+
+    def create(self) -> str:
+        """실행에 사용할 프로필 폴더를 준비하고 경로를 반환."""
+        if not self.ephemeral:
+            os.makedirs(self.shared_dir, exist_ok=True)
+            self.path = self.shared_dir
+            return self.path
+        self.cleanup()  # 이전 실행의 임시 폴더가 남아 있으면 삭제
+        base_dir = self.base_dir or self._default_base_dir() or tempfile.gettempdir()
+        self.remove_stale(base_dir)
+        # 폴더 이름에 PID를 넣어 비정상 종료로 남은 폴더를 다음 실행에서 찾을 수 있도록 함
+        self.path = tempfile.mkdtemp(prefix=f"{self.PROFILE_PREFIX}{os.getpid()}-", dir=base_dir)
+        if self.template_dir and os.path.isdir(self.template_dir):
+            shutil.copytree(self.template_dir, self.path, ignore=self._ignore, symlinks=True, dirs_exist_ok=True)
+        return self.path
+
+    @classmethod
+    def remove_stale(cls, base_dir: str) -> int:
+        """
+        base_dir에서 만든 프로세스가 더 이상 없는 임시 프로필 폴더를 삭제하고 삭제한 개수를 반환.
+        - 비정상 종료(강제 종료, 크래시)로 cleanup()이 실행되지 않아 /dev/shm(RAM)에 남은 폴더 정리
+        - 프로세스 존재 확인이 가능한 POSIX에서만 동작
+        """
+        if os.name != "posix":
+            return 0
+        removed = 0
+        try:
+            entries = list(os.scandir(base_dir))
+        except OSError:
+            return 0
+        for entry in entries:
+            if not entry.name.startswith(cls.PROFILE_PREFIX) or not entry.is_dir(follow_symlinks=False):
+                continue
+            pid = entry.name[len(cls.PROFILE_PREFIX):].split("-", 1)[0]
+            if not pid.isdigit() or int(pid) == os.getpid() or _pid_alive(int(pid)):
+                continue
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed += 1
+        return removed
+
+    def flags(self) -> list:
+        """Chrome 실행 옵션 (create() 이후 호출)."""
+        return [
+            f"--user-data-dir={self.path}",
+            f"--disk-cache-size={self.disk_cache_size}",
+            f"--media-cache-size={self.media_cache_size}",
+        ]
+
+    def save_template(self, template_dir: Optional[str] = None):
+        """
+        현재 프로필(로그인 정보, 설정 등)을 캐시 없이 템플릿으로 저장.
+        - Chrome 종료 후, 임시 폴더를 삭제하기 전에 호출 (cleanup(save_template=True) 또는
+          stop_chrome(save_template=True)을 사용하면 순서대로 처리)
+        """
+        template_dir = template_dir or self.template_dir
+        if not template_dir:
+            raise ValueError("template_dir is required to save a profile template.")
+        if not self.path or not os.path.isdir(self.path):
+            raise RuntimeError("No profile directory to save; call save_template before cleanup().")
+        temporary = f"{template_dir.rstrip(os.sep)}.tmp"
+        shutil.rmtree(temporary, ignore_errors=True)
+        shutil.copytree(self.path, temporary, ignore=self._ignore, symlinks=True)
+        shutil.rmtree(template_dir, ignore_errors=True)
+        os.replace(temporary, template_dir)
+
+    def cleanup(self, save_template: bool = False):
+        """
+        임시 프로필 폴더 삭제 (공유 폴더는 유지).
+        - save_template: True이면 삭제 전에 프로필을 template_dir에 저장
+        """
+        try:
+            if save_template:
+                self.save_template()
+        finally:
+            if self.ephemeral and self.path:
+                shutil.rmtree(self.path, ignore_errors=True)
+            self.path = None
+
 class ChromeProcessManager:
     # Chrome 실행 경로 목록
     CHROME_PATHS = [
@@ -37,12 +335,13 @@ class ChromeProcessManager:
         "--disable-dev-shm-usage",
         "--no-first-run",
         "--log-level=3",
-        "--user-data-dir=C:\\chrometemp"
     ]
     
-    def __init__(self):
+    def __init__(self, profile_manager: Optional[ChromeProfileManager] = None):
+        self.profile_manager = profile_manager or ChromeProfileManager()
         self.process: Optional[subprocess.Popen] = None
         self.port: Optional[int] = None
+        self.ready_seconds: Optional[float] = None  # 마지막 실행에서 DevTools가 준비되기까지 걸린 시간
     
     @property
     def paths(self):
@@ -62,59 +361,92 @@ class ChromeProcessManager:
 
     def start_chrome(self, headless: bool, available_port: int):
         self.port = available_port
-        chrome_path = find_chrome_path(self.CHROME_PATHS)
+        chrome_path = find_chrome_binary(self.CHROME_PATHS)
+        if chrome_path is None:
+            raise ChromeNotFoundError(f"Chrome executable not found in {self.CHROME_PATHS} or PATH.")
         chrome_command = [chrome_path] + self.CHROME_OPTIONS
+        if not any(option.startswith("--user-data-dir") for option in self.CHROME_OPTIONS):
+            # 옵션에 프로필 폴더를 직접 지정하지 않은 경우 프로필 관리자의 폴더 사용
+            self.profile_manager.create()
+            chrome_command += self.profile_manager.flags()
         chrome_command.append(f"--remote-debugging-port={available_port}")
         if headless:
             chrome_command.append("--headless")
-        self.process = subprocess.Popen(chrome_command)
+        if platform.system() == "Windows":
+            self.process = subprocess.Popen(chrome_command, creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+        else:
+            # 새 세션(프로세스 그룹)으로 실행하여 종료 시 GPU/렌더러/zygote 자식 프로세스까지 함께 종료
+            self.process = subprocess.Popen(chrome_command, start_new_session=True)
+
+    def wait_until_ready(self, timeout: float = 15.0) -> dict:
+        """DevTools 엔드포인트가 응답할 때까지 대기하고 /json/version 응답을 반환."""
+        start = time.perf_counter()
+        version = wait_for_devtools(self.port, timeout, self.process)
+        self.ready_seconds = time.perf_counter() - start
+        print(f"[Debug] Chrome DevTools ready in {self.ready_seconds:.3f}s ({version.get('Browser')})")
+        return version
 
-    def stop_chrome(self):
+    def stop_chrome(self, timeout: float = 5.0, save_template: bool = False):
+        """
+        Chrome을 종료하고 임시 프로필을 삭제.
+        - save_template: True이면 삭제 전에 프로필을 템플릿으로 저장 (로그인 상태 등을 다음 실행에 재사용)
+        """
         if platform.system() != "Windows":
-            print("[Debug] Non-Windows: Using simple terminate().")
+            self._stop_chrome_posix(timeout)
+        else:
+            self._stop_chrome_windows()
+        self.process = None
+        self.port = None # 포트 정리
+        self.profile_manager.cleanup(save_template)  # Chrome 종료 후 임시 프로필 삭제
+
+    def _stop_chrome_posix(self, timeout: float):
+        pgid = None
+        if self.process:
+            pgid = self.process.pid  # start_new_session으로 실행했으므로 PID = 프로세스 그룹 ID
+        elif self.port:
+            pid = find_pid_by_port(self.port)
+            if pid is not None:
+                try:
+                    pgid = os.getpgid(pid)
+                except ProcessLookupError:
+                    pgid = None
+        if pgid is None:
+            print("[Debug] No Chrome process to stop.")
+            return
+        if pgid == os.getpgrp():
+            # 다른 방식으로 실행되어 현재 프로세스와 같은 그룹인 경우 그룹 전체를 종료하지 않음
+            print(f"[Debug] Chrome shares our process group. Terminating PID {pgid} only.")
             if self.process:
                 self.process.terminate()
-            self.process = None
+                self.process.wait(timeout=timeout)
             return
 
+        print(f"[Debug] Terminating Chrome process group: {pgid}")
+        if not terminate_process_group(pgid, timeout, self.process):
+            print(f"[Debug] Process group {pgid} is still alive.")
+
+    def _stop_chrome_windows(self):
         if not self.port:
             print("[Debug] No port stored. Cannot find process to kill via port.")
             # 혹시 모르니 self.process라도 종료 시도
             if self.process:
                 print(f"[Debug] Fallback: Terminating self.process (PID: {self.process.pid})")
                 self.process.terminate() # 기본 terminate
-            self.process = None
             return
 
         print(f"[Debug] Finding process using port: {self.port}")
         
         try:
-            # 1. netstat으로 포트를 사용하는 PID 찾기
-            # 'LISTENING' 상태의 프로세스를 찾습니다.
-            cmd = f'netstat -aon | findstr "LISTENING" | findstr ":{self.port}"'
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, encoding='cp949')
-            output = result.stdout.strip()
-            
-            if not output:
+            # 1. netstat 출력에서 포트를 LISTENING 중인 PID 찾기
+            pid_found = find_pid_by_port(self.port)
+            if pid_found is None:
                 print(f"[Debug] No process found listening on port {self.port}.")
                 return
+            print(f"[Debug] Found PID {pid_found} using port {self.port}.")
 
-            print(f"[Debug] netstat output: {output}")
-
-            # 2. netstat 출력에서 PID 파싱 (가장 마지막 숫자)
-            pid_found = None
-            match = re.findall(r'\d+$', output.splitlines()[0].strip()) # 첫 번째 줄의 마지막 숫자
-            if match:
-                pid_found = match[0]
-                print(f"[Debug] Found PID {pid_found} using port {self.port}.")
-            
-            if not pid_found:
-                print(f"[Debug] Could not parse PID from netstat output.")
-                return
-
-            # 3. 찾은 PID로 taskkill 실행 (/T로 자식까지 모두)
+            # 2. 찾은 PID로 taskkill 실행 (/T로 자식까지 모두)
             print(f"[Debug] Killing process tree for PID: {pid_found}")
-            kill_cmd = ['taskkill', '/F', '/T', '/PID', pid_found]
+            kill_cmd = ['taskkill', '/F', '/T', '/PID', str(pid_found)]
             kill_result = subprocess.run(kill_cmd, capture_output=True, text=True, encoding='cp949')
             
             if kill_result.returncode == 0:
@@ -126,20 +458,109 @@ class ChromeProcessManager:
         except Exception as e:
             print(f"[Debug] Error during port-based kill: {e}")
         finally:
-            self.process = None
-            self.port = None # 포트 정리
+            if self.process:
+                self.process.poll()  # 실행 파일 프로세스 회수
+
+def default_cache_dir() -> str:
+    """OS별 사용자 캐시 폴더 (Windows: %LOCALAPPDATA%, 그 외: $XDG_CACHE_HOME 또는 ~/.cache)."""
+    if platform.system() == "Windows":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~\\AppData\\Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return os.path.join(base, "every-crawler")
+
+class ChromeDriverResolver:
+    """
+    Chrome 실행 파일에 맞는 chromedriver 경로를 manifest에 캐시.
+    - manifest: {Chrome 경로: {Chrome 크기/mtime_ns, Chrome 버전, 드라이버 경로/크기/mtime_ns}}
+    - Chrome 실행 파일과 드라이버 파일이 그대로이면 버전 확인·다운로드 없이 저장된 경로를 사용 (오프라인 가능)
+    - Chrome이 업데이트되었거나 드라이버가 없으면 chromedriver_autoinstaller.install()로 다시 찾고 manifest 갱신
+    """
+    def __init__(self, chrome_paths=None, manifest_path=None):
+        self.chrome_paths = chrome_paths or []
+        self.manifest_path = manifest_path or os.path.join(default_cache_dir(), "chromedriver_manifest.json")
+
+    def find_chrome_binary(self) -> Optional[str]:
+        return find_chrome_binary(self.chrome_paths)
+
+    def _load_manifest(self) -> dict:
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save_manifest(self, manifest: dict):
+        # 임시 파일에 기록 후 교체
+        os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+        with open(f"{self.manifest_path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=4)
+        os.replace(f"{self.manifest_path}.tmp", self.manifest_path)
+
+    @staticmethod
+    def _signature(path):
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            return None
+        return [stat_result.st_size, stat_result.st_mtime_ns]
+
+    def lookup(self, chrome_path: str) -> Optional[dict]:
+        """manifest 항목이 유효하면(Chrome·드라이버 파일이 변경되지 않았으면) 반환."""
+        entry = self._load_manifest().get(chrome_path)
+        if (entry and entry.get("chrome") == self._signature(chrome_path)
+                and entry.get("driver") == self._signature(entry.get("driver_path", ""))):
+            return entry
+        return None
+
+    @instrument(name="chromedriver.resolve")
+    def resolve(self) -> Optional[str]:
+        """chromedriver 경로를 반환 (찾을 수 없으면 None: Selenium이 직접 찾도록 함)."""
+        chrome_path = self.find_chrome_binary()
+        if chrome_path is not None:
+            entry = self.lookup(chrome_path)
+            if entry:
+                return entry["driver_path"]
+
+        try:
+            driver_path = chromedriver_autoinstaller.install()
+        except Exception as e:
+            driver_path = None
+            print(f"[Debug] chromedriver install failed: {e}")
+        if not driver_path:
+            # 다운로드할 수 없는 경우(오프라인 등) 이전에 사용한 드라이버가 남아 있으면 사용
+            previous = self._load_manifest().get(chrome_path) if chrome_path else None
+            if previous and os.path.isfile(previous.get("driver_path", "")):
+                print(f"[Debug] Falling back to previous chromedriver: {previous['driver_path']}")
+                return previous["driver_path"]
+            return None
+
+        if chrome_path is not None:
+            manifest = self._load_manifest()
+            manifest[chrome_path] = {
+                "chrome": self._signature(chrome_path),
+                "version": chromedriver_autoinstaller.get_chrome_version(),
+                "driver_path": os.path.abspath(driver_path),
+                "driver": self._signature(driver_path),
+            }
+            self._save_manifest(manifest)
+        return driver_path
 
 class WebDriverController:
     def __init__(self):
         self.browser: Optional["Chrome"] = None
+        self.driver_resolver = ChromeDriverResolver(ChromeProcessManager.CHROME_PATHS)
 
+    @instrument(name="chromedriver.start_driver")
     def start_driver(self, available_port: int):
-        chromedriver_autoinstaller.install()
+        driver_path = self.driver_resolver.resolve()
         options = ChromeOptions()
         options.add_experimental_option("debuggerAddress", f"127.0.0.1:{available_port}")
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_argument(f"--user-agent={get_user_agent()}")
-        self.browser = Chrome(options=options)
+        # 드라이버 경로를 직접 지정하여 Selenium Manager의 드라이버 탐색도 건너뜀
+        service = Service(executable_path=driver_path) if driver_path else Service()
+        self.browser = Chrome(service=service, options=options)
 
     def navigate_to(self, url, maximize, wait):  
         self.browser.get(url)
@@ -183,10 +604,11 @@ class AdvancedStealthService:
             browser.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": script})
             
 class ChromeDriverService(WebDriverController):
-    def __init__(self, args=None, paths=None, stealth_config=None):
-        self.process_manager: ChromeProcessManager = ChromeProcessManager()
+    def __init__(self, args=None, paths=None, stealth_config=None, profile_manager=None):
+        self.process_manager: ChromeProcessManager = ChromeProcessManager(profile_manager)
         self.stealth_manager: AdvancedStealthService = AdvancedStealthService(stealth_config)
         super().__init__()
+        self.driver_resolver.chrome_paths = self.process_manager.paths
 
         if args is not None:
             if isinstance(args, str):
@@ -199,6 +621,7 @@ class ChromeDriverService(WebDriverController):
         if paths is not None:
             if isinstance(paths, list):
                 self.process_manager.paths = paths
+                self.driver_resolver.chrome_paths = paths
             else:
                 raise TypeError("paths must be a string")
             
@@ -216,16 +639,22 @@ class ChromeDriverService(WebDriverController):
             
         return False  # 예외를 다시 발생시켜 상위 코드에서 처리할 수 있도록 함.
 
-    def start(self, url, headless: bool, maximize: bool = True, wait: int = 3):
+    def start(self, url, headless: bool, maximize: bool = True, wait: int = 3, ready_timeout: float = 15.0):
         available_port = find_available_port()
         self.process_manager.start_chrome(headless, available_port)
+        try:
+            # 디버깅 포트가 열리기 전에 드라이버가 연결하지 않도록 준비될 때까지 대기
+            self.process_manager.wait_until_ready(ready_timeout)
+        except ChromeStartupError:
+            self.process_manager.stop_chrome()
+            raise
         self.start_driver(available_port)
         self.navigate_to(url, maximize, wait)
         self.stealth_manager.apply_stealth(self.browser)
 
-    def stop(self):
+    def stop(self, save_template: bool = False):
         self.quit_driver()
-        self.process_manager.stop_chrome()
+        self.process_manager.stop_chrome(save_template=save_template)
 
 
     
\ No newline at end of file
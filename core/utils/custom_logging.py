@@ -1,71 +1,732 @@
-import os, logging
-from datetime import datetime
+import io, os, re, gzip, json, time, queue, shutil, logging, tempfile, threading
 from collections import deque
+from datetime import datetime
+from functools import lru_cache
+
+try:
+    import zstandard  # 선택 의존성: compression="zstd" 사용 시에만 필요
+except ImportError:
+    zstandard = None
+
+READ_BLOCK_SIZE = 64 * 1024  # 역방향 탐색 시 한 번에 읽을 블록 크기
+SEGMENT_EXTENSIONS = {"gzip": ".gz", "zstd": ".zst", None: ""}
+
+def _reverse_lines(filename, encoding="utf-8", block_size=READ_BLOCK_SIZE):
+    """
+    파일 끝(EOF)에서부터 block_size 단위로 역방향 탐색하며 줄을 최신순으로 반환.
+    - 읽은 블록 만큼만 비용이 들며 파일 크기와 무관함
+    - b'\n' 기준으로 분리하므로 UTF-8 등 ASCII 호환 인코딩만 지원
+    """
+    with open(filename, 'rb') as log_file:
+        yield from _reverse_file_lines(log_file, encoding, block_size)
+
+def _reverse_file_lines(log_file, encoding="utf-8", block_size=READ_BLOCK_SIZE):
+    """열린 바이너리 파일을 끝에서부터 block_size 단위로 읽어 줄을 최신순으로 반환."""
+    position = log_file.seek(0, os.SEEK_END)
+    remainder = b''
+    trailing = True  # 파일 마지막의 개행 문자는 빈 줄로 취급하지 않음
+    while position > 0:
+        read_size = min(block_size, position)
+        position -= read_size
+        log_file.seek(position)
+        lines = (log_file.read(read_size) + remainder).split(b'\n')
+        remainder = lines.pop(0)  # 블록 앞부분은 이전 블록의 줄과 이어질 수 있음
+        for line in reversed(lines):
+            if trailing:
+                trailing = False
+                if not line:
+                    continue
+            yield line.rstrip(b'\r').decode(encoding)
+    if remainder or not trailing:
+        yield remainder.rstrip(b'\r').decode(encoding)
+
+def _manifest_path(filename):
+    return f"{filename}.manifest.json"
+
+def _load_manifest(filename):
+    """로테이션된 세그먼트 목록(manifest)을 읽음. 없으면 빈 manifest를 반환."""
+    try:
+        with open(_manifest_path(filename), 'r', encoding="utf-8") as manifest_file:
+            return json.load(manifest_file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"active_start": None, "segments": []}
+
+def _save_manifest(filename, manifest):
+    # 임시 파일에 기록 후 교체하여 읽는 쪽이 깨진 manifest를 보지 않도록 함
+    path = _manifest_path(filename)
+    with open(f"{path}.tmp", 'w', encoding="utf-8") as manifest_file:
+        json.dump(manifest, manifest_file, indent=4)
+    os.replace(f"{path}.tmp", path)
+
+def _to_timestamp(value):
+    return value.timestamp() if isinstance(value, datetime) else value
+
+def _open_segment_bytes(path, codec):
+    """세그먼트를 (압축을 풀면서 읽는) 바이너리 스트림으로 엶."""
+    if codec == "gzip":
+        return gzip.open(path, 'rb')
+    if codec == "zstd":
+        if zstandard is None:
+            raise ImportError("zstandard is required to read zstd-compressed log segments.")
+        return zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True)
+    return open(path, 'rb')
+
+def _open_segment(path, codec, encoding):
+    if codec is None:
+        return open(path, 'r', encoding=encoding)
+    return io.TextIOWrapper(_open_segment_bytes(path, codec), encoding=encoding)
+
+def _segment_reverse_lines(path, codec, encoding, max_lines=None):
+    """
+    세그먼트의 줄을 최신순으로 반환.
+    - 압축 세그먼트는 역방향 탐색이 불가하므로 블록 단위로 풀면서 읽음 (시간 기준 로테이션은 크기 제한이 없음)
+      - max_lines가 있으면 마지막 max_lines 줄만 deque에 유지
+      - 없으면 임시 파일에 풀어 놓고 비압축 파일처럼 끝에서부터 읽음
+    """
+    if codec is None:
+        yield from _reverse_lines(path, encoding)
+        return
+    if max_lines is not None:
+        with _open_segment(path, codec, encoding) as segment_file:
+            lines = deque((line.rstrip('\r\n') for line in segment_file), maxlen=max_lines)
+        yield from reversed(lines)
+        return
+    with tempfile.TemporaryFile() as spill:
+        with _open_segment_bytes(path, codec) as segment_file:
+            shutil.copyfileobj(segment_file, spill, READ_BLOCK_SIZE)
+        yield from _reverse_file_lines(spill, encoding)
+
+def _iter_segments(filename, since=None, until=None):
+    """
+    현재 로그 파일과 로테이션된 세그먼트를 최신순으로 (path, codec) 형태로 반환.
+    - since/until(timestamp 또는 datetime)이 주어지면 manifest의 시간 범위로 필요 없는 세그먼트를 건너뜀
+    """
+    since, until = _to_timestamp(since), _to_timestamp(until)
+    manifest = _load_manifest(filename)
+    active_start = manifest.get("active_start")
+    if until is None or active_start is None or active_start <= until:
+        if os.path.exists(filename) or not manifest["segments"]:
+            yield filename, None
+
+    directory = os.path.dirname(os.path.abspath(filename))
+    for segment in reversed(manifest["segments"]):
+        start, end = segment.get("start"), segment.get("end")
+        if since is not None and end is not None and end < since:
+            break  # 이후 세그먼트는 모두 더 오래된 것
+        if until is not None and start is not None and start > until:
+            continue
+        yield os.path.join(directory, segment["file"]), segment.get("codec")
+
+def _reverse_log_lines(filename, encoding="utf-8", since=None, until=None, max_lines=None):
+    """
+    모든 세그먼트에 걸쳐 로그 줄을 최신순으로 반환 (필요한 세그먼트만 순서대로 열림).
+    - max_lines: 최대 반환 줄 수 (압축 세그먼트는 남은 줄 수만큼만 메모리에 유지)
+    """
+    remaining = max_lines
+    for path, codec in _iter_segments(filename, since, until):
+        if remaining == 0:
+            return
+        for line in _segment_reverse_lines(path, codec, encoding, remaining):
+            yield line
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    return
 
 def read_logs(filename, encoding="utf-8", num_lines=None) -> str:
     try:
-        with open(filename, 'r', encoding=encoding) as log_file:
-            if num_lines is None:
-                return log_file.read()
-            else:
-                return ''.join(deque(log_file, maxlen=num_lines))  # O(1) 메모리 최적화
+        if num_lines is None:
+            # 전체 로그: 오래된 세그먼트부터 현재 파일까지 순서대로 이어 붙임
+            parts = []
+            for path, codec in reversed(list(_iter_segments(filename))):
+                with _open_segment(path, codec, encoding) as log_file:
+                    parts.append(log_file.read())
+            return ''.join(parts)
+        # 마지막 num_lines 줄만 역방향으로 읽음 (파일 전체를 읽지 않음)
+        lines = list(_reverse_log_lines(filename, encoding, max_lines=num_lines))
+        return ''.join(f"{line}\n" for line in reversed(lines))
     except FileNotFoundError:
         return f"Log file '{filename}' not found."
     except Exception as e:
         return f"Error reading log file: {e}"
+
+def search_logs(filename, pattern, limit=None, encoding="utf-8", num_lines=None, since=None, until=None):
+    """
+    로그를 최신순으로 탐색하며 pattern과 일치하는 re.Match 객체를 반환하는 제너레이터.
+    - pattern: 정규식 문자열 또는 컴파일된 패턴 (한 번만 컴파일)
+    - limit: 최대 일치 개수 (도달 시 탐색 중단)
+    - num_lines: 최근 num_lines 줄까지만 탐색
+    - since/until: 해당 시간 범위와 겹치는 세그먼트만 탐색
+    """
+    if limit is not None and limit <= 0:
+        return
+    regex = re.compile(pattern)
+    found_count = 0
+    for line in _reverse_log_lines(filename, encoding, since, until, num_lines):
+        match = regex.search(line)
+        if match:
+            yield match
+            found_count += 1
+            if found_count == limit:
+                return
         
+def _index_path(filename):
+    return f"{filename}.idx"
+
+def _read_index(filename):
+    """
+    사이드카 인덱스를 읽어 ({bucket: {level: offset}}, [(start, end), ...]) 형태로 반환.
+    - 두 번째 값은 인덱스를 기록한 핸들러가 쓴 바이트 구간 (그 밖의 구간은 인덱스에 없는 레코드)
+    """
+    buckets, covered = {}, []
+    try:
+        with open(_index_path(filename), 'r', encoding="utf-8") as index_file:
+            for line in index_file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # 기록 중 잘린 마지막 줄
+                if "covered" in entry:
+                    covered.append(tuple(entry["covered"]))
+                    continue
+                levels = buckets.setdefault(entry["bucket"], {})
+                levels.setdefault(entry["level"], entry["offset"])
+    except FileNotFoundError:
+        pass
+    return buckets, covered
+
+def _load_index(filename):
+    """사이드카 인덱스를 읽어 {bucket: {level: offset}} 형태로 반환."""
+    return _read_index(filename)[0]
+
+def _merge_regions(regions):
+    merged = []
+    for start, end in sorted(regions):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))  # 겹치거나 인접한 구간 병합
+        elif start < end:
+            merged.append((start, end))
+    return merged
+
+def _indexed_regions(filename, level=None, since=None, until=None, bucket_size=60):
+    """
+    인덱스를 이용해 조건에 맞는 레코드가 있을 수 있는 (start, end) 바이트 구간 목록을 반환.
+    - 인덱스가 기록되기 전의 레코드나 index=False 핸들러가 추가한 레코드처럼 인덱스가 다루지 않는
+      구간은 조건과 관계없이 모두 포함
+    인덱스가 없으면 None을 반환 (전체 탐색 필요)
+    """
+    buckets, covered = _read_index(filename)
+    if not buckets:
+        return None
+    size = os.path.getsize(filename)
+    # 버킷 구간: 버킷의 첫 레코드 offset부터 다음 버킷의 첫 레코드 offset까지
+    starts = sorted((min(levels.values()), bucket) for bucket, levels in buckets.items())
+    regions = []
+    for position, (start, bucket) in enumerate(starts):
+        if since is not None and bucket + bucket_size <= since:
+            continue
+        if until is not None and bucket > until:
+            continue
+        levels = buckets[bucket]
+        if level is not None:
+            if level not in levels:
+                continue
+            start = levels[level]
+        end = starts[position + 1][0] if position + 1 < len(starts) else size
+        regions.append((start, end))
+
+    # 인덱스가 다루지 않는 구간 (covered의 여집합)
+    position = 0
+    for start, end in _merge_regions(covered):
+        if start > position:
+            regions.append((position, min(start, size)))
+        position = max(position, end)
+    if position < size:
+        regions.append((position, size))
+    return _merge_regions(regions)
+
+def _read_regions(filename, regions, encoding):
+    with open(filename, 'rb') as log_file:
+        for start, end in regions:
+            log_file.seek(start)
+            data = log_file.read() if end is None else log_file.read(end - start)
+            for line in data.decode(encoding).splitlines():
+                yield line
+
+def _record_time(record, datefmt='%Y-%m-%d %H:%M:%S'):
+    try:
+        return datetime.strptime(record["time"], datefmt).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def query_logs(filename, level=None, since=None, until=None, encoding="utf-8", bucket_size=60):
+    """
+    JSON-lines 로그에서 조건에 맞는 레코드(dict)를 오래된 순으로 반환하는 제너레이터.
+    - level: "ERROR" 등 레벨 이름
+    - since/until: timestamp 또는 datetime
+    - 현재 파일은 사이드카 인덱스('<filename>.idx')로 필요한 구간만 seek 하여 읽음
+    - 인덱스가 없는 파일과 압축된 세그먼트는 전체를 읽어 필터링
+    """
+    since, until = _to_timestamp(since), _to_timestamp(until)
+    for path, codec in reversed(list(_iter_segments(filename, since, until))):
+        regions = _indexed_regions(path, level, since, until, bucket_size) if codec is None else None
+        if regions is not None:
+            lines = _read_regions(path, regions, encoding)
+        else:
+            with _open_segment(path, codec, encoding) as segment_file:
+                lines = segment_file.read().splitlines()
+
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # JSON 형식이 아닌 줄은 무시
+            if not isinstance(record, dict):
+                continue
+            if level is not None and record.get("level") != level:
+                continue
+            if since is not None or until is not None:
+                created = _record_time(record)
+                if created is not None and (
+                    (since is not None and created < since) or (until is not None and created > until)
+                ):
+                    continue
+            yield record
+
+@lru_cache(maxsize=512)
+def _relpath(pathname):
+    """pathname별 상대 경로를 캐시 (레코드마다 os.path.relpath를 호출하지 않음)."""
+    try:
+        return os.path.relpath(pathname)
+    except ValueError:  # 경로가 잘못된 경우 대비
+        return pathname
+
 class CustomFormatter(logging.Formatter):
     def __init__(self, fmt=None, datefmt=None, style='%', validate=True):
         if not fmt:
             #fmt = "%(asctime)s - %(levelname)s - %(funcName)s - %(message)s"
             fmt = "%(asctime)s - %(levelname)s - %(relpath)s:%(lineno)d - %(funcName)s - %(message)s"
         super().__init__(fmt, datefmt, style, validate)  # 부모 클래스의 __init__ 호출
+        # 포맷 문자열 검사 결과를 미리 계산해 레코드마다 반복하지 않음
+        self._uses_relpath = "relpath" in self._fmt
+        self._uses_time = super().usesTime()
+        self._time_cache = (None, None, None)  # (초, datefmt, 포맷된 문자열)
+
+    def usesTime(self):
+        return self._uses_time
 
     def format(self, record):
-        try:
-            record.relpath = os.path.relpath(record.pathname)
-        except ValueError:  # 경로가 잘못된 경우 대비
-            record.relpath = record.pathname
+        # 포맷에 relpath가 없으면 계산하지 않음
+        if self._uses_relpath:
+            record.relpath = _relpath(record.pathname)
         return super().format(record)
     
     def formatTime(self, record, datefmt=None):
         # 원하는 형식을 명시
         datefmt = datefmt or '%Y-%m-%d %H:%M:%S'  # Default: YYYY-MM-DD HH:MM:SS,ms
-        ct = self.converter(record.created)  # 기본 시간 변환기 사용 (localtime)
-        return datetime.fromtimestamp(record.created).strftime(datefmt)
+        # 같은 초 안의 레코드는 이전에 포맷한 문자열을 재사용 (초 미만 단위 포맷은 제외)
+        second = int(record.created)
+        cached = self._time_cache
+        if cached[0] == second and cached[1] == datefmt:
+            return cached[2]
+        formatted = datetime.fromtimestamp(record.created).strftime(datefmt)
+        if "%f" not in datefmt:
+            self._time_cache = (second, datefmt, formatted)
+        return formatted
+
+class JsonLinesFormatter(CustomFormatter):
+    """
+    한 레코드를 한 줄의 JSON으로 출력하는 포맷터.
+    필드는 기본 포맷과 동일: time, level, relpath, lineno, funcName, message
+    """
+    def format(self, record):
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            message = f"{message}\n{record.exc_text}"
+        if record.stack_info:
+            message = f"{message}\n{self.formatStack(record.stack_info)}"
+        return json.dumps({
+            "time": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "relpath": _relpath(record.pathname),
+            "lineno": record.lineno,
+            "funcName": record.funcName,
+            "message": message,
+        }, ensure_ascii=False)
 
 class BaseFileHandler(logging.FileHandler):
-    def __init__(self, filename, mode='a', encoding='utf-8'):
+    """
+    파일 핸들러.
+    - max_bytes: 파일 크기가 이 값을 넘으면 세그먼트로 로테이션 (0이면 사용 안 함)
+    - rotate_interval: 세그먼트 시작 후 이 시간(초)이 지나면 로테이션 (None이면 사용 안 함)
+    - backup_count: 보관할 세그먼트 수 (0이면 모두 보관)
+    - compression: 닫힌 세그먼트 압축 방식 ("gzip", "zstd", None)
+    - index: True이면 (시간 버킷, 레벨)별 첫 레코드의 바이트 offset을 '<filename>.idx'에 기록
+    - index_bucket: 인덱스 시간 버킷 크기(초)
+    로테이션된 세그먼트와 시간 범위는 '<filename>.manifest.json'에 기록됨
+    """
+    def __init__(self, filename, mode='a', encoding='utf-8',
+                 max_bytes=0, rotate_interval=None, backup_count=0, compression="gzip",
+                 index=False, index_bucket=60):
         directory = os.path.dirname(filename)
         if directory:
             os.makedirs(directory, exist_ok=True)
+        if compression not in SEGMENT_EXTENSIONS:
+            raise ValueError(f"Unsupported compression '{compression}'. Expected 'gzip', 'zstd' or None.")
+        if compression == "zstd" and zstandard is None:
+            raise ImportError("zstandard is required for compression='zstd'.")
+        self.index = index
+        self.index_bucket = index_bucket
         super().__init__(filename, mode, encoding)
+        self.max_bytes = max_bytes
+        self.rotate_interval = rotate_interval
+        self.backup_count = backup_count
+        self.compression = compression
+        self._segment_start = None
+        self._segment_end = None
+        if self.rotating:
+            self._segment_start = _load_manifest(self.baseFilename).get("active_start")
+        self._index_stream = None
+        self._index_keys = set()
+        self._covered = None  # 이번 핸들러가 기록한 [시작, 끝] 바이트 구간 (인덱스에 "covered"로 기록)
+        self._covered_saved = None
+        if self.index:
+            if 'w' in mode:
+                self._remove_index()
+            self._index_keys = {
+                (bucket, level) for bucket, levels in _load_index(self.baseFilename).items() for level in levels
+            }
+
+    @property
+    def rotating(self) -> bool:
+        return bool(self.max_bytes or self.rotate_interval)
+
+    def _open(self):
+        if not self.index:
+            return super()._open()
+        # 인덱스 offset이 실제 바이트 위치와 일치하도록 개행 변환을 하지 않음
+        return open(self.baseFilename, self.mode, encoding=self.encoding, errors=self.errors, newline='\n')
+
+    def emit(self, record):
+        if not (self.rotating or self.index):
+            return super().emit(record)
+        try:
+            self._write_records([record])
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def _write_records(self, records) -> int:
+        """레코드 여러 개를 포맷하여 한 번의 write로 기록하고 기록한 문자 수를 반환."""
+        if self.rotating and records:
+            self._rollover_if_expired(records[0].created)
+        if self.stream is None:
+            self.stream = self._open()
+        formatted = []  # (레코드, 기록할 문자열) - 포맷에 실패한 레코드는 제외
+        for record in records:
+            try:
+                formatted.append((record, self._format_record(record) + self.terminator))
+            except Exception:
+                self.handleError(record)
+        text = ''.join(part for _, part in formatted)
+        if text:
+            if self.index:
+                self._index_records(formatted)
+            self.stream.write(text)
+            if self.rotating:
+                self._track_segment(records[0].created, records[-1].created)
+        return len(text)
+
+    def _format_record(self, record):
+        return self.format(record)
+
+    def _index_records(self, formatted):
+        """
+        이번에 기록할 레코드 중 처음 등장한 (시간 버킷, 레벨)의 바이트 offset을 인덱스에 추가.
+        - formatted: 포맷에 성공한 (레코드, 기록할 문자열) 목록
+        """
+        entries = []
+        offset = self.stream.tell()
+        if self._covered is None or self._covered[1] != offset:
+            # 처음 기록하거나 다른 곳에서 파일에 추가된 경우 새 구간 시작
+            self._save_covered()
+            self._covered = [offset, offset]
+        for record, part in formatted:
+            key = (int(record.created // self.index_bucket) * self.index_bucket, record.levelname)
+            if key not in self._index_keys:
+                self._index_keys.add(key)
+                entries.append(json.dumps({"bucket": key[0], "level": key[1], "offset": offset}))
+            offset += len(part.encode(self.encoding or "utf-8"))
+        self._covered[1] = offset
+        if entries:
+            # 새 항목과 함께 지금까지 기록한 구간도 갱신 (그 사이 구간은 읽을 때 전체 탐색)
+            entries.append(json.dumps({"covered": self._covered}))
+            self._write_index(entries)
+            self._covered_saved = list(self._covered)
+
+    def _write_index(self, entries):
+        if self._index_stream is None:
+            self._index_stream = open(_index_path(self.baseFilename), 'a', encoding="utf-8")
+        self._index_stream.write('\n'.join(entries) + '\n')
+        self._index_stream.flush()
+
+    def _save_covered(self):
+        # 아직 인덱스에 기록하지 않은 구간 끝을 기록
+        if self._covered is not None and self._covered != self._covered_saved:
+            self._write_index([json.dumps({"covered": self._covered})])
+            self._covered_saved = list(self._covered)
+
+    def _remove_index(self):
+        if self._index_stream:
+            self._index_stream.close()
+            self._index_stream = None
+        self._index_keys = set()
+        self._covered = None
+        self._covered_saved = None
+        try:
+            os.remove(_index_path(self.baseFilename))
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self.index:
+            self._save_covered()
+        if self._index_stream:
+            self._index_stream.close()
+            self._index_stream = None
+        super().close()
+
+    def _rollover_if_expired(self, created):
+        if (self.rotate_interval and self._segment_start is not None
+                and created - self._segment_start >= self.rotate_interval):
+            self.doRollover()
+
+    def _track_segment(self, first_created, last_created):
+        if self._segment_start is None:
+            self._segment_start = first_created
+            manifest = _load_manifest(self.baseFilename)
+            manifest["active_start"] = first_created
+            _save_manifest(self.baseFilename, manifest)
+        self._segment_end = last_created
+        if self.max_bytes and self.stream.tell() >= self.max_bytes:
+            self.doRollover()
+
+    def doRollover(self):
+        """현재 파일을 닫아 세그먼트로 이동·압축하고 manifest에 등록한 뒤 새 파일을 염."""
+        if self.stream:
+            self.stream.close()
+            self.stream = None
+        if not os.path.exists(self.baseFilename) or os.path.getsize(self.baseFilename) == 0:
+            return
+
+        stamp = datetime.fromtimestamp(self._segment_end or time.time()).strftime("%Y%m%d-%H%M%S-%f")
+        segment_path = f"{self.baseFilename}.{stamp}{SEGMENT_EXTENSIONS[self.compression]}"
+        os.replace(self.baseFilename, f"{self.baseFilename}.{stamp}")
+        if self.compression:
+            self._compress_segment(f"{self.baseFilename}.{stamp}", segment_path)
+
+        manifest = _load_manifest(self.baseFilename)
+        manifest["segments"].append({
+            "file": os.path.basename(segment_path),
+            "start": self._segment_start,
+            "end": self._segment_end,
+            "codec": self.compression,
+        })
+        manifest["active_start"] = None
+        if self.backup_count and len(manifest["segments"]) > self.backup_count:
+            expired = manifest["segments"][:-self.backup_count]
+            manifest["segments"] = manifest["segments"][-self.backup_count:]
+            for segment in expired:
+                try:
+                    os.remove(os.path.join(os.path.dirname(self.baseFilename), segment["file"]))
+                except FileNotFoundError:
+                    pass
+        _save_manifest(self.baseFilename, manifest)
+
+        self._segment_start = None
+        self._segment_end = None
+        if self.index:
+            self._remove_index()  # 인덱스는 현재(비압축) 파일에 대해서만 유지
+        self.stream = self._open()
+
+    def _compress_segment(self, source, target):
+        with open(source, 'rb') as source_file, open(target, 'wb') as target_file:
+            if self.compression == "zstd":
+                zstandard.ZstdCompressor().copy_stream(source_file, target_file)
+            else:
+                with gzip.GzipFile(fileobj=target_file, mode='wb') as gzip_file:
+                    shutil.copyfileobj(source_file, gzip_file)
+        os.remove(source)
+
+class _FlushRequest:
+    """writer 스레드에 flush를 요청하고 완료를 기다리기 위한 마커."""
+    def __init__(self):
+        self.done = threading.Event()
+
+_STOP = object()  # writer 스레드 종료 마커
+
+class AsyncFileHandler(BaseFileHandler):
+    """
+    큐 기반 비동기 파일 핸들러.
+    - emit은 메시지 인자만 합쳐 큐에 넣으며, 호출 스레드는 포맷/파일 I/O를 하지 않음
+    - 백그라운드 writer 스레드가 쌓인 레코드를 batch_size 개씩 모아 한 번에 기록
+    - 기록한 양이 flush_size 문자를 넘거나 flush_interval 초가 지나면 flush
+    - close() 시 큐에 남은 레코드를 모두 기록한 뒤 종료
+    - 로테이션 옵션(max_bytes 등)은 BaseFileHandler와 동일 (로테이션·압축도 writer 스레드에서 수행)
+    """
+    def __init__(self, filename, mode='a', encoding='utf-8',
+                 batch_size=1024, flush_size=64 * 1024, flush_interval=1.0, **rotation_options):
+        super().__init__(filename, mode, encoding, **rotation_options)
+        self.batch_size = batch_size
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self._thread = threading.Thread(
+            target=self._writer, name=f"AsyncFileHandler({self.baseFilename})", daemon=True
+        )
+        self._thread.start()
+
+    def handle(self, record):
+        # 큐가 스레드 안전하므로 핸들러 lock 없이 바로 enqueue
+        rv = self.filter(record)
+        if rv:
+            self.emit(record)
+        return rv
+
+    def prepare(self, record):
+        """
+        큐에 넣기 전에 호출 스레드에서 필요한 최소한만 처리 (전체 포맷은 writer 스레드에서 수행).
+        - args를 메시지에 합쳐 큐에 있는 동안 args가 바뀌어도 기록 내용이 달라지지 않도록 함
+        - exc_info가 있으면 traceback 문자열(exc_text)만 남겨 traceback 객체를 큐에 붙잡아 두지 않음
+        """
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = (self.formatter or logging.Formatter()).formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def emit(self, record):
+        try:
+            self.queue.put(self.prepare(record))
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        """큐에 쌓인 레코드를 모두 기록하고 stream을 flush할 때까지 대기."""
+        if not self._thread.is_alive():
+            return super().flush()
+        request = _FlushRequest()
+        self.queue.put(request)
+        request.done.wait(timeout=max(self.flush_interval, 1.0) * 10)
+
+    def close(self):
+        if self._thread.is_alive():
+            self.queue.put(_STOP)
+            self._thread.join()
+        super().close()
+
+    def _flush_stream(self):
+        try:
+            if self.stream and hasattr(self.stream, "flush"):
+                self.stream.flush()
+        except Exception:
+            pass
+
+    def _writer(self):
+        unflushed = 0
+        last_flush = time.monotonic()
+        while True:
+            try:
+                # 기록 후 flush되지 않은 내용이 있으면 flush_interval 까지만 대기
+                batch = [self.queue.get(timeout=self.flush_interval if unflushed else None)]
+            except queue.Empty:
+                self._flush_stream()
+                unflushed, last_flush = 0, time.monotonic()
+                continue
+
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            records = [item for item in batch if isinstance(item, logging.LogRecord)]
+            if records:
+                try:
+                    unflushed += self._write_records(records)
+                except Exception:
+                    self.handleError(records[-1])
+
+            requests = [item for item in batch if isinstance(item, _FlushRequest)]
+            stop = any(item is _STOP for item in batch)
+            now = time.monotonic()
+            if stop or requests or unflushed >= self.flush_size or now - last_flush >= self.flush_interval:
+                self._flush_stream()
+                unflushed, last_flush = 0, now
+            for request in requests:
+                request.done.set()
+            if stop:
+                return
 
 class CustomLogging(logging.Logger):
     def __init__(self, name):
         super().__init__(name)
         self.setLevel(logging.DEBUG)
 
-    def addHandler(self, filename, fmt=None, mode='a', encoding='utf-8'):
+    def addHandler(self, filename, fmt=None, mode='a', encoding='utf-8', async_mode=False, json_lines=False, **handler_options):
+        """
+        파일 핸들러 추가.
+        - async_mode: True이면 AsyncFileHandler를 사용 (호출 스레드는 enqueue 비용만 부담)
+        - json_lines: True이면 JsonLinesFormatter로 한 줄에 하나의 JSON 레코드를 기록
+        - handler_options: 로테이션/인덱스 옵션 (max_bytes, rotate_interval, backup_count, compression, index)
+        """
         if filename is None:
             raise ValueError("filename cannot be None. A valid log file path is required.")
         for handler in self.handlers:
             if isinstance(handler, BaseFileHandler) and handler.baseFilename == os.path.abspath(filename):
                 return
-        handler = BaseFileHandler(filename, mode, encoding)
-        handler.setFormatter(CustomFormatter(fmt))
+        handler_class = AsyncFileHandler if async_mode else BaseFileHandler
+        handler = handler_class(filename, mode, encoding, **handler_options)
+        handler.setFormatter(JsonLinesFormatter(fmt) if json_lines else CustomFormatter(fmt))
         super().addHandler(handler)
 
+    def close(self):
+        """등록된 핸들러를 모두 flush/close 하고 제거 (비동기 핸들러는 큐를 비운 뒤 종료)."""
+        for handler in list(self.handlers):
+            handler.close()
+            self.removeHandler(handler)
+
 class GetLogger:
     _instances = {}  # 여러 개의 싱글톤 인스턴스를 저장할 딕셔너리
 
-    def __new__(cls, logger_type, logger_name=None, fmt=None, logger_option="GlobalLogger") -> CustomLogging:
+    def __new__(cls, logger_type, logger_name=None, fmt=None, logger_option="GlobalLogger", async_mode=False, **handler_options) -> CustomLogging:
         if logger_type not in cls._instances:
             logger = CustomLogging(logger_option)  # logger_option을 로거 이름으로 사용
-            logger.addHandler(logger_name, fmt)
+            logger.addHandler(logger_name, fmt, async_mode=async_mode, **handler_options)
             cls._instances[logger_type] = logger  # 특정 타입의 로거 저장
         return cls._instances[logger_type]  # 동일한 타입의 로거 반환
 
+    @classmethod
+    def shutdown(cls, logger_type=None):
+        """
+        로거를 종료하고 싱글톤 목록에서 제거.
+        - logger_type이 None이면 모든 로거를 종료
+        - 비동기 모드의 경우 큐에 남은 레코드를 모두 기록한 뒤 반환
+        """
+        logger_types = list(cls._instances) if logger_type is None else [logger_type]
+        for key in logger_types:
+            logger = cls._instances.pop(key, None)
+            if logger is not None:
+                logger.close()
+
 if __name__=="__main__":
     logger = GetLogger(
         "logger", "src/logs/test.log", 
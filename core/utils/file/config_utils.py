@@ -1,28 +1,31 @@
 import yaml
-import os
+from core.utils.file.settings import settings
 
-# YAML 파일 읽기
-def load_config(config_path="config/config.yaml"):
-    if not os.path.exists(config_path):
-        return {}
+def _parse_yaml(config_path):
     with open(config_path, "r") as file:
-        return yaml.safe_load(file)
-    
+        return yaml.safe_load(file) or {}
+
+# YAML 파일 읽기 (파일이 바뀌었을 때만 다시 파싱)
+def load_config(config_path="config/config.yaml"):
+    config = settings.get(config_path, _parse_yaml)
+    return dict(config) if isinstance(config, dict) else config  # 캐시가 수정되지 않도록 복사본 반환
+
 # YAML 파일에 키-값 저장
 def save_config(data, config_path="config/config.yaml"):
     with open(config_path, "w") as file:
         yaml.dump(data, file)
+    settings.invalidate(config_path)
+
+# 설정 파일 변경 시 callback(경로, 새 설정) 호출
+def watch_config(callback, config_path="config/config.yaml"):
+    return settings.watch(config_path, _parse_yaml, callback)
 
 class ConfigLoader:
     def __new__(cls, config_path="config/config.yaml"):
         # Create a temporary instance
         instance = super(ConfigLoader, cls).__new__(cls)
-        instance.config = {}
-        instance.load_env(config_path)
+        instance.config = instance.load_env(config_path)
         return instance.config  # Return the config object directly
 
     def load_env(self, config_path):
-        if not os.path.exists(config_path):
-            return {}
-        with open(config_path, "r") as file:
-            return yaml.safe_load(file)
\ No newline at end of file
+        return load_config(config_path)
@@ -1,42 +1,222 @@
 import os
-import hashlib
+import csv
+import json
+import shutil
+from core.utils.file.hashing import hash_file, hash_file_partial, hash_files
+from core.utils.file.hashing import DEFAULT_ALGORITHM, DEFAULT_CHUNK_SIZE, PARTIAL_HASH_SIZE
+from core.utils.file.hash_cache import HashCache, CACHE_FILENAME
+from core.utils.file.walker import iter_files, iter_size_groups
 
 valid_extensions = (".jpg", ".jpeg", ".png", ".mp4", ".avi")  # 허용할 파일 확장자
+actions = ("delete", "quarantine", "hardlink")  # 중복 파일 처리 방식
+HASH_BATCH_FILES = 1024  # 한 번에 해시할 최대 파일 수 (여러 크기 그룹을 묶어 스레드 풀에 전달)
 
-def calculate_file_hash(file_path):
-    """파일의 MD5 해시를 계산."""
-    hasher = hashlib.md5()
-    with open(file_path, 'rb') as f:
-        while chunk:= f.read(8192):  # 8KB 단위로 파일 읽기
-            hasher.update(chunk)
-    return hasher.hexdigest()
+def calculate_file_hash(file_path, algorithm=DEFAULT_ALGORITHM, chunk_size=DEFAULT_CHUNK_SIZE):
+    """파일의 해시를 계산 (기본 MD5)."""
+    return hash_file(file_path, algorithm, chunk_size)
 
-def remove_duplicate_files(folder_path="D:/insta_download"):
+def calculate_partial_hash(file_path, size=None, algorithm=DEFAULT_ALGORITHM, partial_size=PARTIAL_HASH_SIZE):
+    """
+    파일의 앞/뒤 partial_size 바이트만 해시.
+    - 파일 크기가 2 * partial_size 이하이면 파일 전체를 해시 (전체 해시와 동일한 값)
+    """
+    return hash_file_partial(file_path, size, algorithm, partial_size)
+
+def _regroup(groups, digests):
+    """(크기, 파일 목록) 그룹을 해시 값으로 다시 나누고, 파일이 하나뿐인 그룹은 제외."""
+    for size, group in groups:
+        buckets = {}
+        for file_path in group:
+            buckets.setdefault(digests[file_path], []).append(file_path)
+        yield from ((size, bucket) for bucket in buckets.values() if len(bucket) > 1)
+
+def _batched(size_groups, max_files=HASH_BATCH_FILES):
+    batch, count = [], 0
+    for size, group in size_groups:
+        batch.append((size, group))
+        count += len(group)
+        if count >= max_files:
+            yield batch
+            batch, count = [], 0
+    if batch:
+        yield batch
+
+def _iter_duplicate_groups(folder_path, algorithm=DEFAULT_ALGORITHM, workers=None, cache=None, exclude=()):
+    """
+    walk → filter → 크기별 묶음 → 부분/전체 해시 단계를 거쳐 (크기, [경로, ...]) 중복 그룹을 반환.
+    크기 그룹을 HASH_BATCH_FILES 단위로 처리하므로 메모리는 배치 크기로 제한됨
+    """
+    files = iter_files(folder_path, valid_extensions, exclude)
+    for batch in _batched(iter_size_groups(files)):
+        stats = {path: stat for _, group in batch for path, stat in group}
+
+        def digest_all(groups, hash_func, kind):
+            paths = [path for _, group in groups for path in group]
+            if cache is None:
+                return hash_files(paths, hash_func, workers, algorithm=algorithm)
+            return cache.hash_files(paths, stats, hash_func, kind, workers, algorithm)
+
+        size_groups = [(size, [path for path, _ in group]) for size, group in batch]
+        partial_groups = list(_regroup(size_groups, digest_all(size_groups, hash_file_partial, "partial")))
+
+        # 부분 해시가 이미 파일 전체를 해시한 값인 작은 파일은 그대로 확정
+        yield from ((size, group) for size, group in partial_groups if size <= 2 * PARTIAL_HASH_SIZE)
+        large_groups = [(size, group) for size, group in partial_groups if size > 2 * PARTIAL_HASH_SIZE]
+        if large_groups:
+            yield from _regroup(large_groups, digest_all(large_groups, hash_file, "full"))
+
+def find_duplicate_files(folder_path, algorithm=DEFAULT_ALGORITHM, workers=None, cache=None):
+    """
+    폴더 내 내용이 같은 파일 그룹을 하나씩 반환하는 제너레이터 (각 그룹은 탐색 순서대로 정렬).
+    1. os.scandir로 탐색하며 확장자로 거르고 크기별로 묶음 (크기가 유일한 파일은 읽지 않음)
+    2. 앞/뒤 64KB 부분 해시로 다시 묶음
+    3. 부분 해시까지 같은 파일만 전체 해시로 확인
+    - algorithm: 해시 알고리즘 (예: "md5", "blake2b")
+    - workers: 해시 계산 스레드 수
+    - cache: HashCache (지정 시 변경되지 않은 파일은 저장된 해시를 재사용)
+    """
+    for _, group in _iter_duplicate_groups(folder_path, algorithm, workers, cache):
+        yield group
+
+class DuplicateReport:
+    """중복 파일 처리 결과를 CSV 또는 JSON(.json) 파일로 한 줄씩 기록."""
+    FIELDS = ("action", "path", "original", "size", "reason")
+
+    def __init__(self, report_path):
+        directory = os.path.dirname(report_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.report_path = report_path
+        self.is_json = report_path.lower().endswith(".json")
+        self.file = open(report_path, "w", encoding="utf-8", newline="")
+        self.count = 0
+        if self.is_json:
+            self.file.write("[")
+        else:
+            self.writer = csv.DictWriter(self.file, fieldnames=self.FIELDS)
+            self.writer.writeheader()
+
+    def __enter__(self) -> "DuplicateReport":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_obj) -> bool:
+        self.close()
+        return False
+
+    def write(self, row):
+        if self.is_json:
+            self.file.write(("," if self.count else "") + "\n    " + json.dumps(row, ensure_ascii=False))
+        else:
+            self.writer.writerow(row)
+        self.count += 1
+
+    def close(self):
+        if self.is_json:
+            self.file.write("\n]\n")
+        self.file.close()
+
+def _apply_action(action, file_path, original, folder_path, quarantine_dir):
+    if action == "delete":
+        os.remove(file_path)
+    elif action == "quarantine":
+        # 폴더 구조를 유지한 채 격리 폴더로 이동
+        target = os.path.join(quarantine_dir, os.path.relpath(file_path, folder_path))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.move(file_path, target)
+    elif action == "hardlink":
+        # 임시 이름으로 하드 링크를 만든 뒤 교체하여 중간에 실패해도 파일이 사라지지 않도록 함
+        temporary = f"{file_path}.dedup-tmp"
+        os.link(original, temporary)
+        os.replace(temporary, file_path)
+
+def remove_duplicate_files(folder_path="D:/insta_download", algorithm=DEFAULT_ALGORITHM, workers=None,
+                           use_cache=True, cache_path=None, perceptual=False, threshold=5,
+                           perceptual_algorithm="dhash", dry_run=False, report_path=None,
+                           action="delete", quarantine_dir=None):
     """
     폴더 내 중복 파일 제거.
     - folder_path: 탐색할 폴더 경로
     - valid_extensions: 처리할 파일 확장자 목록
+    - use_cache: 해시 캐시 사용 여부 (변경되지 않은 파일은 다시 해시하지 않음)
+    - cache_path: 캐시 DB 경로 (기본: folder_path/.hash_cache.sqlite3)
+    - perceptual: True이면 내용이 같은 파일 제거 후, 재인코딩·크기 변경된 비슷한 이미지도 제거
+    - threshold: perceptual 모드에서 같은 이미지로 볼 지각 해시 해밍 거리
+    - perceptual_algorithm: "dhash" 또는 "phash"
+    - dry_run: True이면 파일을 변경하지 않고 보고서만 작성 (기본 보고서: 현재 폴더의 duplicate_report.csv)
+      탐색 폴더에는 아무것도 만들지 않으며, cache_path를 지정하지 않으면 기존 캐시를 읽기 전용으로만 사용
+    - report_path: 처리 결과 보고서 경로 (.csv 또는 .json). 지정 시 중복 파일별 출력 대신 보고서에 기록
+    - action: "delete"(삭제), "quarantine"(quarantine_dir로 이동), "hardlink"(원본에 대한 하드 링크로 교체)
+    - 같은 내용의 파일 중 먼저 탐색된 파일만 남기고 나머지를 처리
     """
     if not os.path.isdir(folder_path):
         print(f"Error: {folder_path} is not a valid directory.")
         return
-    
-    file_hashes = {}
-    for root, _, files in os.walk(folder_path):
-        for file_name in files:
-            file_path = os.path.join(root, file_name)
-            # 파일 확장자 확인
-            if not file_name.lower().endswith(valid_extensions):
-                continue
-
-            file_hash = calculate_file_hash(file_path)
-
-            # 중복된 파일이 이미 기록된 경우 삭제
-            if file_hash in file_hashes:
-                print(f"Duplicate found: {file_path} (same as {file_hashes[file_hash]})")
-                os.remove(file_path)
-            else:
-                # 해시값과 파일 경로를 기록
-                file_hashes[file_hash] = file_path
-
-    print("Duplicate removal completed.")
\ No newline at end of file
+    if action not in actions:
+        raise ValueError(f"Invalid action '{action}'. Expected one of {actions}.")
+    if action == "quarantine" and not quarantine_dir:
+        raise ValueError("quarantine_dir is required when action is 'quarantine'.")
+
+    if dry_run and report_path is None:
+        report_path = "duplicate_report.csv"  # 탐색 폴더가 아닌 현재 폴더에 작성
+    report = DuplicateReport(report_path) if report_path else None
+    cache = None
+    if use_cache and dry_run and cache_path is None:
+        # 탐색 폴더에 캐시 파일을 만들거나 수정하지 않고, 이미 있는 캐시만 읽음
+        default_cache = os.path.join(folder_path, CACHE_FILENAME)
+        if os.path.exists(default_cache):
+            cache = HashCache(default_cache, read_only=True)
+    elif use_cache:
+        cache = HashCache.for_folder(folder_path, cache_path)
+    exclude = (quarantine_dir,) if quarantine_dir else ()
+    total_files, total_bytes = 0, 0
+    reported = set()  # perceptual 단계에서 중복 보고를 막기 위한 처리 완료 경로 (중복 파일만 보관)
+
+    def handle(file_path, original, size, reason):
+        nonlocal total_files, total_bytes
+        if action == "hardlink" and os.path.samefile(file_path, original):
+            return  # 이미 같은 파일에 대한 하드 링크
+        total_files += 1
+        total_bytes += size
+        if perceptual and dry_run:
+            reported.add(file_path)
+        if report is not None:
+            report.write({
+                "action": "none" if dry_run else action,
+                "path": file_path, "original": original, "size": size, "reason": reason,
+            })
+        else:
+            print(f"Duplicate found: {file_path} (same as {original}, {reason})")
+        if dry_run:
+            return
+        _apply_action(action, file_path, original, folder_path, quarantine_dir)
+        if cache is not None and action != "hardlink":
+            cache.discard(file_path)
+
+    try:
+        for size, group in _iter_duplicate_groups(folder_path, algorithm, workers, cache, exclude):
+            original, *duplicates = group
+            for file_path in duplicates:
+                handle(file_path, original, size, "exact")
+
+        if perceptual:
+            from core.utils.file.perceptual import find_similar_images  # numpy가 필요한 경우에만 import
+            for original, similar in find_similar_images(
+                folder_path, threshold, perceptual_algorithm, workers=workers, cache=cache, exclude=exclude
+            ):
+                for file_path, distance in similar:
+                    if file_path not in reported:  # dry_run에서 이미 보고된 파일은 제외
+                        handle(file_path, original, os.path.getsize(file_path), f"perceptual:{distance}")
+
+        if cache is not None:
+            cache.prune(folder_path)  # 외부에서 삭제된 파일의 항목 정리
+    finally:
+        if cache is not None:
+            cache.close()
+        if report is not None:
+            report.close()
+
+    verb = "found" if dry_run else {"delete": "removed", "quarantine": "quarantined", "hardlink": "hardlinked"}[action]
+    print(f"{total_files} duplicate files ({total_bytes / (1024 * 1024):.1f} MB) {verb}.")
+    if report is not None:
+        print(f"Report written: {report_path}")
+    print("Duplicate removal completed.")
@@ -1,16 +1,29 @@
-from dotenv import load_dotenv, set_key, dotenv_values
+from dotenv import set_key, dotenv_values
 import os
+from core.utils.file.settings import settings
 
-# .env 파일 읽기
-def load_env(dotenv_path="./.env"):
-    load_dotenv(dotenv_path)
+def _parse_env(dotenv_path):
     return dotenv_values(dotenv_path)
 
+# .env 파일 읽기 (파일이 바뀌었을 때만 다시 파싱)
+def load_env(dotenv_path="./.env"):
+    values = settings.get(dotenv_path, _parse_env)
+    # load_dotenv와 동일하게 이미 설정된 환경 변수는 덮어쓰지 않음
+    for key, value in values.items():
+        if value is not None and key not in os.environ:
+            os.environ[key] = value
+    return dict(values)
+
 # .env 파일에 키-값 저장
 def save_env(key, value, dotenv_path=".env"):
     if not os.path.exists(dotenv_path):
         open(dotenv_path, "w").close()  # .env 파일이 없으면 생성
     set_key(dotenv_path, key, value)
+    settings.invalidate(dotenv_path)
+
+# .env 파일 변경 시 callback(경로, 새 값) 호출
+def watch_env(callback, dotenv_path=".env"):
+    return settings.watch(dotenv_path, _parse_env, callback)
 
 class envLoader:
     def __new__(cls, dotenv_path=".env"):
@@ -21,6 +34,6 @@ class envLoader:
         return instance.config  # Return the config object directly
 
     def load_env(self, dotenv_path=".env"):
-        load_dotenv(dotenv_path=dotenv_path)
+        load_env(dotenv_path)
         self.config["my_id"] = os.getenv("my_id")
-        self.config["my_password"] = os.getenv("my_password")
\ No newline at end of file
+        self.config["my_password"] = os.getenv("my_password")
@@ -0,0 +1,178 @@
+import os
+import sqlite3
+import pathlib
+from core.utils.file.hashing import hash_files
+
+CACHE_FILENAME = ".hash_cache.sqlite3"  # 기본 캐시 위치: 대상 폴더 내 이 파일
+LOOKUP_BATCH = 500  # 한 번의 SELECT ... IN (...)에 넣을 최대 경로 수 (SQLite 변수 개수 제한 이하)
+PENDING_FLUSH_ROWS = 4096  # 메모리에 모아 둘 최대 기록 행 수 (넘으면 트랜잭션 안에서 먼저 기록)
+
+
+class HashCache:
+    """
+    SQLite 기반 해시 캐시.
+    - (경로, 해시 종류, 알고리즘)별로 size, mtime_ns, inode와 해시 값을 저장
+    - 파일의 size, mtime_ns, inode가 모두 같으면 저장된 해시를 재사용
+    - 조회는 요청한 경로 묶음만 SQL로 읽으므로 메모리는 캐시 전체가 아닌 배치 크기에 비례
+    - 변경 사항은 하나의 트랜잭션에 기록하고 commit() 시 확정
+    """
+    def __init__(self, db_path, read_only=False):
+        """
+        - read_only: True이면 기존 캐시 파일을 읽기만 함 (put/discard/prune은 기록하지 않음, 파일이 없으면 오류)
+        """
+        self.db_path = db_path
+        self.read_only = read_only
+        if read_only:
+            uri = f"{pathlib.Path(os.path.abspath(db_path)).as_uri()}?mode=ro"
+            self.connection = sqlite3.connect(uri, uri=True)
+        else:
+            directory = os.path.dirname(db_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self.connection = sqlite3.connect(db_path)
+            self.connection.execute(
+                """
+                CREATE TABLE IF NOT EXISTS hashes (
+                    path TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    algorithm TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    mtime_ns INTEGER NOT NULL,
+                    inode INTEGER NOT NULL,
+                    digest TEXT NOT NULL,
+                    PRIMARY KEY (path, kind, algorithm)
+                )
+                """
+            )
+        # 이번 실행에서 조회한 경로 (prune 시 존재 확인을 건너뜀)
+        self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen (path TEXT PRIMARY KEY)")
+        self._pending = {}  # {(경로, 해시 종류, 알고리즘): (size, mtime_ns, inode, digest)}
+
+    @classmethod
+    def for_folder(cls, folder_path, cache_path=None):
+        return cls(cache_path or os.path.join(folder_path, CACHE_FILENAME))
+
+    def __enter__(self) -> "HashCache":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_obj) -> bool:
+        self.close()
+        return False
+
+    @staticmethod
+    def _key_path(path):
+        return os.path.normcase(os.path.abspath(path))
+
+    def _flush(self):
+        # 모아 둔 행을 열린 트랜잭션에 기록 (commit 전까지 확정되지 않음)
+        if self._pending:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [key + row for key, row in self._pending.items()]
+            )
+            self._pending.clear()
+
+    def _lookup(self, key_paths, kind, algorithm):
+        """{경로: (size, mtime_ns, inode, digest)} - LOOKUP_BATCH개씩 나누어 조회."""
+        self._flush()
+        entries = {}
+        for start in range(0, len(key_paths), LOOKUP_BATCH):
+            batch = key_paths[start:start + LOOKUP_BATCH]
+            self.connection.executemany("INSERT OR IGNORE INTO seen VALUES (?)", [(path,) for path in batch])
+            rows = self.connection.execute(
+                "SELECT path, size, mtime_ns, inode, digest FROM hashes "
+                f"WHERE kind = ? AND algorithm = ? AND path IN ({','.join('?' * len(batch))})",
+                (kind, algorithm, *batch)
+            )
+            for path, size, mtime_ns, inode, digest in rows:
+                entries[path] = (size, mtime_ns, inode, digest)
+        return entries
+
+    @staticmethod
+    def _matches(entry, stat_result):
+        return entry is not None and entry[:3] == (stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino)
+
+    def get(self, path, stat_result, kind, algorithm):
+        """파일이 변경되지 않았으면 저장된 해시를, 아니면 None을 반환."""
+        key_path = self._key_path(path)
+        entry = self._lookup([key_path], kind, algorithm).get(key_path)
+        return entry[3] if self._matches(entry, stat_result) else None
+
+    def put(self, path, stat_result, kind, algorithm, digest):
+        if self.read_only:
+            return
+        self._pending[(self._key_path(path), kind, algorithm)] = (
+            stat_result.st_size, stat_result.st_mtime_ns, stat_result.st_ino, digest
+        )
+        if len(self._pending) >= PENDING_FLUSH_ROWS:
+            self._flush()
+
+    def discard(self, path):
+        """삭제한 파일의 항목을 제거."""
+        if self.read_only:
+            return
+        self._flush()
+        self.connection.execute("DELETE FROM hashes WHERE path = ?", (self._key_path(path),))
+
+    def prune(self, folder_path):
+        """
+        folder_path 아래에서 더 이상 존재하지 않는 파일의 항목을 제거하고 제거한 경로 수를 반환.
+        - 이번 실행에서 조회한 경로는 존재 확인 없이 유지, 나머지만 한 줄씩 읽어 확인
+        - 없어진 경로는 임시 테이블에 모은 뒤 DELETE 한 번으로 제거
+        - read_only이면 아무것도 하지 않고 0을 반환
+        """
+        if self.read_only:
+            return 0
+        self._flush()
+        prefix = os.path.join(self._key_path(folder_path), "")
+        upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)  # prefix로 시작하는 경로의 범위 (기본 키 인덱스 사용)
+        self.connection.execute("CREATE TEMP TABLE IF NOT EXISTS missing (path TEXT PRIMARY KEY)")
+        self.connection.execute("DELETE FROM missing")
+        rows = self.connection.execute(
+            "SELECT DISTINCT path FROM hashes WHERE path >= ? AND path < ? "
+            "AND path NOT IN (SELECT path FROM temp.seen)",
+            (prefix, upper)
+        )
+        while True:
+            batch = rows.fetchmany(LOOKUP_BATCH)
+            if not batch:
+                break
+            missing = [(path,) for path, in batch if not os.path.exists(path)]
+            self.connection.executemany("INSERT INTO missing VALUES (?)", missing)
+        count = self.connection.execute("SELECT COUNT(*) FROM missing").fetchone()[0]
+        if count:
+            self.connection.execute("DELETE FROM hashes WHERE path IN (SELECT path FROM temp.missing)")
+        self.connection.execute("DELETE FROM missing")
+        return count
+
+    def hash_files(self, file_paths, stats, hash_func, kind, workers=None, algorithm="md5", **hash_options):
+        """
+        캐시에 없거나 변경된 파일만 hash_func로 해시하여 {경로: 해시}를 반환.
+        - stats: {경로: os.stat_result} (탐색 시 얻은 stat 재사용)
+        """
+        file_paths = list(file_paths)
+        key_paths = {path: self._key_path(path) for path in file_paths}
+        entries = self._lookup(list(dict.fromkeys(key_paths.values())), kind, algorithm)
+        digests, misses = {}, []
+        for path in file_paths:
+            entry = entries.get(key_paths[path])
+            if self._matches(entry, stats[path]):
+                digests[path] = entry[3]
+            else:
+                misses.append(path)
+        for path, digest in hash_files(misses, hash_func, workers, algorithm=algorithm, **hash_options).items():
+            if digest is not None:  # 해시할 수 없는 파일(예: 손상된 이미지)은 저장하지 않음
+                self.put(path, stats[path], kind, algorithm, digest)
+            digests[path] = digest
+        return digests
+
+    def commit(self):
+        """변경 사항을 확정."""
+        if self.read_only:
+            return
+        self._flush()
+        self.connection.commit()
+
+    def close(self):
+        self.commit()
+        self.connection.close()
@@ -0,0 +1,80 @@
+import os
+import mmap
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_ALGORITHM = "md5"
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB 단위로 읽기
+MMAP_THRESHOLD = 256 * 1024 * 1024  # use_mmap=None일 때 이 크기 이상의 파일은 mmap으로 해시
+PARTIAL_HASH_SIZE = 64 * 1024  # 부분 해시에 사용할 앞/뒤 바이트 수
+
+_local = threading.local()  # 스레드별로 재사용하는 읽기 버퍼
+
+
+def _buffer(chunk_size):
+    buffer = getattr(_local, "buffer", None)
+    if buffer is None or len(buffer) != chunk_size:
+        buffer = _local.buffer = bytearray(chunk_size)
+    return buffer
+
+
+def hash_file(file_path, algorithm=DEFAULT_ALGORITHM, chunk_size=DEFAULT_CHUNK_SIZE, use_mmap=None):
+    """
+    파일 전체의 해시를 계산.
+    - algorithm: hashlib 알고리즘 이름 (예: "md5", "sha1", "blake2b")
+    - chunk_size: 읽기 단위. 스레드별 bytearray에 readinto로 읽어 chunk마다 bytes를 새로 만들지 않음
+    - use_mmap: True이면 mmap으로 한 번에 해시, None이면 MMAP_THRESHOLD 이상인 파일만 mmap 사용
+    """
+    hasher = hashlib.new(algorithm)
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size
+        if use_mmap is None:
+            use_mmap = size >= MMAP_THRESHOLD
+        if use_mmap and size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                hasher.update(mapped)
+            return hasher.hexdigest()
+
+        buffer = _buffer(chunk_size)
+        view = memoryview(buffer)
+        while read_size := f.readinto(buffer):
+            hasher.update(view[:read_size])
+    return hasher.hexdigest()
+
+
+def hash_file_partial(file_path, size=None, algorithm=DEFAULT_ALGORITHM, partial_size=PARTIAL_HASH_SIZE):
+    """
+    파일의 앞/뒤 partial_size 바이트만 해시.
+    - 파일 크기가 2 * partial_size 이하이면 파일 전체를 해시 (hash_file과 동일한 값)
+    """
+    hasher = hashlib.new(algorithm)
+    with open(file_path, 'rb', buffering=0) as f:
+        size = os.fstat(f.fileno()).st_size if size is None else size
+        if size <= 2 * partial_size:
+            hasher.update(f.read())
+        else:
+            buffer = _buffer(partial_size)
+            view = memoryview(buffer)
+            hasher.update(view[:f.readinto(buffer)])
+            f.seek(-partial_size, os.SEEK_END)
+            hasher.update(view[:f.readinto(buffer)])
+    return hasher.hexdigest()
+
+
+def hash_files(file_paths, hash_func=hash_file, workers=None, **hash_options):
+    """
+    여러 파일을 스레드 풀에서 해시하여 {경로: 해시} 딕셔너리를 반환 (입력 순서 유지).
+    - hashlib은 해시 계산 중 GIL을 해제하므로 스레드로 병렬화됨
+    - workers: 스레드 수 (None이면 CPU 수 기준, 1이면 현재 스레드에서 순차 처리)
+    - hash_options: hash_func에 전달할 인자 (algorithm, chunk_size 등)
+    """
+    file_paths = list(file_paths)
+    if workers is None:
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    if workers <= 1 or len(file_paths) <= 1:
+        return {path: hash_func(path, **hash_options) for path in file_paths}
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda path: hash_func(path, **hash_options), file_paths)
+        return dict(zip(file_paths, digests))
@@ -0,0 +1,121 @@
+import os
+import re
+import threading
+from PIL import Image, UnidentifiedImageError
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp", ".gif")  # 내보내기 대상 확장자
+
+_NATURAL_SPLIT = re.compile(r"(\d+)")
+
+# {(폴더 경로, 하위 폴더 포함 여부): ({폴더: mtime_ns}, [ImageInfo, ...])}
+_scan_cache = {}
+_scan_lock = threading.Lock()
+
+
+def natural_sort_key(name):
+    """
+    숫자 부분을 정수로 비교하는 정렬 키 (screenshot_2 < screenshot_10).
+    - 대소문자 무시, 형식이 달라도 예외 없이 정렬
+    """
+    parts = _NATURAL_SPLIT.split(name.lower())
+    parts[1::2] = map(int, parts[1::2])  # 홀수 위치는 항상 숫자
+    return parts
+
+
+class ImageInfo:
+    """
+    탐색한 이미지 파일 정보.
+    - path, relpath(탐색 폴더 기준), stat은 탐색 시 채워짐
+    - size(가로, 세로)는 처음 접근할 때 헤더만 읽어 계산 (디코딩하지 않음), 읽을 수 없으면 None
+    """
+    __slots__ = ("path", "relpath", "stat", "_size")
+
+    def __init__(self, path, relpath, stat_result):
+        self.path = path
+        self.relpath = relpath
+        self.stat = stat_result
+        self._size = False  # 아직 읽지 않음
+
+    def __fspath__(self):
+        return self.path
+
+    def __repr__(self):
+        return f"ImageInfo({self.path!r})"
+
+    @property
+    def size(self):
+        if self._size is False:
+            try:
+                with Image.open(self.path) as img:
+                    self._size = img.size
+            except (OSError, UnidentifiedImageError):
+                self._size = None
+        return self._size
+
+    @property
+    def width(self):
+        return self.size[0] if self.size else None
+
+    @property
+    def height(self):
+        return self.size[1] if self.size else None
+
+
+def _scan(folder_path, recursive):
+    # 반환: ({폴더: mtime_ns}, [ImageInfo, ...]) — 폴더 mtime은 목록을 읽기 전에 기록
+    directory_mtimes, images = {}, []
+    stack = [folder_path]
+    while stack:
+        directory = stack.pop()
+        try:
+            directory_mtimes[directory] = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # 숨김 폴더(.prescale_cache 등)는 제외
+                            if recursive and not entry.name.startswith("."):
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file():
+                            relpath = os.path.relpath(entry.path, folder_path)
+                            images.append(ImageInfo(entry.path, relpath, entry.stat()))
+                    except OSError:
+                        continue  # 탐색 중 삭제되었거나 접근할 수 없는 항목
+        except OSError:
+            if directory == folder_path:
+                raise
+            continue  # 접근할 수 없는 하위 폴더는 건너뜀
+    images.sort(key=lambda info: natural_sort_key(info.relpath))
+    return directory_mtimes, images
+
+
+def _is_fresh(directory_mtimes):
+    try:
+        return all(os.stat(directory).st_mtime_ns == mtime for directory, mtime in directory_mtimes.items())
+    except OSError:
+        return False
+
+
+def scan_images(image_folder, recursive=False, use_cache=True):
+    """
+    폴더의 이미지 파일을 자연 정렬 순서(상대 경로 기준)로 ImageInfo 목록으로 반환.
+    - recursive: True이면 하위 폴더까지 탐색 (숨김 폴더 제외)
+    - use_cache: 탐색한 폴더들의 mtime이 그대로이면 이전 목록을 재사용 (파일 추가/삭제/이름 변경 시 다시 탐색)
+    - 같은 이름의 파일을 덮어쓴 경우에는 폴더 mtime이 바뀌지 않으므로 stat이 이전 값일 수 있음
+    """
+    key = (os.path.abspath(image_folder), recursive)
+    if use_cache:
+        with _scan_lock:
+            cached = _scan_cache.get(key)
+        if cached and _is_fresh(cached[0]):
+            return list(cached[1])
+
+    directory_mtimes, images = _scan(image_folder, recursive)
+    with _scan_lock:
+        _scan_cache[key] = (directory_mtimes, images)
+    return list(images)
+
+
+def clear_scan_cache():
+    with _scan_lock:
+        _scan_cache.clear()
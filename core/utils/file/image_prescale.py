@@ -0,0 +1,68 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+from core.utils.file.hash_cache import HashCache
+from core.utils.file.hashing import hash_file
+
+CACHE_DIRNAME = ".prescale_cache"  # 기본 캐시 위치: 이미지 폴더 내 이 폴더
+
+
+def _has_alpha(img):
+    return img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+
+
+def prescale_image(source, target, size, quality):
+    """
+    source를 size(가로, 세로) 픽셀로 축소하여 target에 저장 (프로세스 풀에서 실행).
+    - 슬라이드에서 어차피 슬라이드 크기로 늘려 표시하므로 비율을 유지하지 않고 size에 맞춤
+    - 투명도가 있는 이미지는 PNG, 그 외에는 JPEG(quality)으로 저장
+    - 이미 size 이하인 이미지는 확대하지 않고 그대로 다시 인코딩
+    """
+    with Image.open(source) as img:
+        img.draft("RGB", size)  # JPEG은 축소된 크기로 디코딩
+        if img.width > size[0] or img.height > size[1]:
+            img = img.resize(size, Image.LANCZOS)
+        if target.endswith(".png"):
+            img.save(f"{target}.tmp", "PNG", optimize=True)
+        else:
+            img.convert("RGB").save(f"{target}.tmp", "JPEG", quality=quality, optimize=True)
+    os.replace(f"{target}.tmp", target)  # 중단되어도 불완전한 캐시 파일이 남지 않도록 함
+    return target
+
+
+def prescale_images(image_files, size, quality=85, cache_dir=None, workers=None):
+    """
+    이미지를 슬라이드 픽셀 크기로 미리 축소하고 캐시된 파일 경로 목록을 (입력 순서대로) 반환.
+    - 캐시 파일 이름: <원본 해시>_<가로>x<세로>_q<quality>.<확장자>
+    - 원본 해시는 cache_dir의 HashCache에 저장하여 변경되지 않은 원본은 다시 읽지 않음
+    - 캐시에 없는 이미지만 프로세스 풀(workers)에서 병렬로 변환
+    """
+    if not image_files:
+        return []
+    cache_dir = cache_dir or os.path.join(os.path.dirname(image_files[0]), CACHE_DIRNAME)
+    os.makedirs(cache_dir, exist_ok=True)
+
+    with HashCache(os.path.join(cache_dir, ".hash_cache.sqlite3")) as cache:
+        stats = {path: os.stat(path) for path in image_files}
+        digests = cache.hash_files(image_files, stats, hash_file, "full", workers=1, algorithm="md5")
+
+    targets, jobs, scheduled = [], [], set()
+    for path in image_files:
+        with Image.open(path) as img:  # 헤더만 읽어 투명도 여부 확인
+            extension = "png" if _has_alpha(img) else "jpg"
+        target = os.path.join(cache_dir, f"{digests[path]}_{size[0]}x{size[1]}_q{quality}.{extension}")
+        targets.append(target)
+        if target not in scheduled and not os.path.exists(target):
+            scheduled.add(target)
+            jobs.append((path, target))
+
+    if jobs:
+        if workers == 1 or len(jobs) == 1:
+            for source, target in jobs:
+                prescale_image(source, target, size, quality)
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(prescale_image, source, target, size, quality) for source, target in jobs]
+                for future in futures:
+                    future.result()
+    return targets
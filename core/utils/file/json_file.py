@@ -1,33 +1,344 @@
+import os
 import json
+import hashlib
+import threading
+
+JSON_FILE = "config/Location_Info.json"  # 이전 형식 (JSON 배열 전체를 매번 다시 씀)
+JSONL_FILE = "config/Location_Info.jsonl"  # 추가 전용 JSON Lines 저장소
+DELETE_KEY = "$delete"  # 삭제 기록 줄: {"$delete": 레코드}
+COMPACT_MIN_DEAD = 1024  # 무효 줄이 이 개수 이상이고 유효 레코드보다 많으면 자동 압축
+READ_CHUNK_SIZE = 64 * 1024  # JSON 배열을 나누어 읽는 단위 (문자 수)
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+def _filtered(records, predicate=None, limit=None):
+    # predicate를 만족하는 레코드를 limit개까지 반환하고 그 이후는 읽지 않음
+    if limit is not None and limit <= 0:
+        return
+    count = 0
+    for record in records:
+        if predicate is None or predicate(record):
+            yield record
+            count += 1
+            if count == limit:
+                return
+
+
+def _iter_array(f, chunk_size):
+    buffer, pos, eof = "", 0, False
+
+    def fill(size):
+        nonlocal buffer, pos, eof
+        chunk = f.read(size)
+        if not chunk:
+            eof = True
+        buffer = buffer[pos:] + chunk  # 이미 처리한 부분은 버려 버퍼 크기를 제한
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill(chunk_size)
+
+    def fail(message):
+        raise json.JSONDecodeError(message, buffer, pos)
+
+    skip_whitespace()
+    if pos == len(buffer):
+        return  # 빈 파일
+    if buffer[pos] != "[":
+        # 최상위가 배열이 아니면 값 하나를 그대로 반환
+        fill(-1)
+        yield json.loads(buffer)
+        return
+    pos += 1
+
+    skip_whitespace()
+    if buffer[pos:pos + 1] == "]":
+        return
+    while True:
+        skip_whitespace()
+        while True:
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+                value, end = None, None
+            # 값 뒤에 구분 문자가 올 때만 확정 (버퍼 끝에서 잘린 숫자 123 → 12, 1.5e3 → 1.5 방지)
+            if end is not None and (eof or (end < len(buffer) and buffer[end] in _DELIMITERS)):
+                break
+            fill(max(chunk_size, len(buffer) - pos))  # 큰 요소는 읽는 양을 늘려 재시도 횟수를 줄임
+        pos = end
+        yield value
+
+        skip_whitespace()
+        if pos == len(buffer):
+            fail("Unterminated JSON array")
+        if buffer[pos] == "]":
+            return
+        if buffer[pos] != ",":
+            fail("Expecting ',' delimiter")
+        pos += 1
+
+
+def iter_json_array(path, predicate=None, limit=None, chunk_size=READ_CHUNK_SIZE):
+    """
+    최상위 JSON 배열 파일을 나누어 읽으며 요소를 하나씩 반환하는 제너레이터.
+    - 메모리에는 읽기 버퍼와 현재 요소만 유지 (json.load처럼 문서 전체를 읽지 않음)
+    - predicate: 지정 시 True를 반환한 요소만 반환
+    - limit: 반환할 최대 개수 (도달하면 나머지는 읽지 않음, 예: limit=1로 첫 일치 항목만 찾기)
+    - 최상위가 배열이 아니면 값 하나를 반환
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        yield from _filtered(_iter_array(f, chunk_size), predicate, limit)
+
+
+def _encode(record):
+    # 튜플은 리스트로 저장되므로 (1, 2)와 [1, 2]는 같은 레코드
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _record_key(record):
+    # 중복 확인용 키: 딕셔너리 키 순서와 무관한 정규화 JSON의 해시 (메모리 절약을 위해 16바이트만 보관)
+    canonical = json.dumps(record, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).digest()
+
+
+class JsonRecordStore:
+    """
+    추가 전용 JSON Lines 레코드 저장소.
+    - 한 줄에 레코드 하나, 추가는 파일 끝에 한 줄만 기록 (파일 전체를 다시 쓰지 않음)
+    - 메모리에는 {레코드 키: 줄 위치} 해시 인덱스만 유지하여 O(1)로 중복 확인
+    - 삭제는 삭제 기록 줄을 추가하고, 무효 줄이 쌓이면 유효 레코드만 임시 파일에 기록 후 교체(압축)
+    - 다른 프로세스가 추가/압축한 경우 파일 크기·inode 변화를 감지하여 인덱스를 갱신
+    """
+    def __init__(self, path=JSONL_FILE, legacy_path=None, compact_min_dead=COMPACT_MIN_DEAD):
+        """
+        - legacy_path: 저장소 파일이 없을 때 한 번 가져올 이전 형식(JSON 배열) 파일
+        """
+        self.path = path
+        self.legacy_path = legacy_path
+        self.compact_min_dead = compact_min_dead
+        self._lock = threading.RLock()
+        self._index = None  # {레코드 키: 줄 시작 위치}
+        self._dead = 0  # 중복/삭제로 무효가 된 줄 수
+        self._end = 0  # 인덱스에 반영한 파일 끝 위치
+        self._inode = None
+
+    def __len__(self):
+        with self._lock:
+            return len(self._sync())
+
+    def __contains__(self, record):
+        with self._lock:
+            return _record_key(record) in self._sync()
+
+    def __iter__(self):
+        return self.iter_records()
+
+    def _migrate(self):
+        # 이전 형식 파일을 저장소 형식으로 변환 (원본은 그대로 둠)
+        if self.legacy_path and not os.path.exists(self.path) and os.path.exists(self.legacy_path):
+            try:
+                self._rewrite(iter_json_array(self.legacy_path))  # 요소를 하나씩 읽어 바로 기록
+            except json.JSONDecodeError:
+                self._rewrite([])
+
+    def _replay(self, f, start):
+        # start부터 파일 끝까지 읽어 인덱스에 반영 (마지막 줄이 기록 중이면 다음에 다시 읽음)
+        f.seek(start)
+        offset = start
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            line_offset, offset = offset, offset + len(line)
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                # 중단된 기록 등으로 손상된 줄은 건너뜀 (무효 줄로 세어 압축 시 제거)
+                print(f"[ERROR] Skipping undecodable line at offset {line_offset} in {self.path}")
+                self._dead += 1
+                continue
+            if isinstance(record, dict) and DELETE_KEY in record and len(record) == 1:
+                if self._index.pop(_record_key(record[DELETE_KEY]), None) is not None:
+                    self._dead += 1  # 삭제된 레코드 줄
+                self._dead += 1  # 삭제 기록 줄
+                continue
+            key = _record_key(record)
+            if key in self._index:
+                self._dead += 1  # 여러 프로세스가 동시에 추가한 중복 레코드
+            else:
+                self._index[key] = line_offset
+        self._end = offset
+
+    def _sync(self):
+        """인덱스를 파일 상태에 맞게 갱신하고 반환."""
+        if self._index is None:
+            self._migrate()
+        try:
+            stat_result = os.stat(self.path)
+        except FileNotFoundError:
+            self._index, self._dead, self._end, self._inode = {}, 0, 0, None
+            return self._index
+        if self._index is None or stat_result.st_ino != self._inode or stat_result.st_size < self._end:
+            # 처음 읽거나, 다른 프로세스가 파일을 교체(압축)한 경우 전체 다시 읽기
+            self._index, self._dead, self._end, self._inode = {}, 0, 0, stat_result.st_ino
+        if stat_result.st_size > self._end:
+            with open(self.path, "rb") as f:
+                self._replay(f, self._end)
+        return self._index
+
+    def _write_lines(self, lines):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        data = "".join(lines).encode("utf-8")
+        with open(self.path, "a+b") as f:
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    # 이전 기록이 중간에 끊긴 경우 새 레코드가 같은 줄에 붙지 않도록 줄을 끝냄
+                    data = b"\n" + data
+            f.write(data)
+
+    def append(self, record):
+        """레코드를 추가. 이미 있는 레코드이면 기록하지 않고 False를 반환."""
+        with self._lock:
+            index = self._sync()
+            key = _record_key(record)
+            if key in index:
+                return False
+            self._write_lines([_encode(record) + "\n"])
+            self._sync()
+            return True
+
+    def extend(self, records):
+        """여러 레코드를 한 번에 추가하고 추가한 개수를 반환."""
+        with self._lock:
+            index = self._sync()
+            keys, lines = set(), []
+            for record in records:
+                key = _record_key(record)
+                if key not in index and key not in keys:
+                    keys.add(key)
+                    lines.append(_encode(record) + "\n")
+            if lines:
+                self._write_lines(lines)
+                self._sync()
+            return len(lines)
+
+    def remove(self, record):
+        """레코드를 삭제. 없는 레코드이면 False를 반환."""
+        with self._lock:
+            if _record_key(record) not in self._sync():
+                return False
+            self._write_lines([_encode({DELETE_KEY: record}) + "\n"])
+            self._sync()
+            self._maybe_compact()
+            return True
+
+    def iter_records(self):
+        """유효한 레코드를 추가 순서대로 하나씩 반환하는 제너레이터 (파일 전체를 메모리로 읽지 않음)."""
+        with self._lock:
+            live_offsets = set(self._sync().values())
+            end, inode = self._end, self._inode
+            if not live_offsets:
+                return
+            f = open(self.path, "rb")
+        with f:
+            if os.fstat(f.fileno()).st_ino != inode:
+                # 스냅샷 이후 다른 프로세스가 압축한 경우: 새 파일 기준으로 다시 시작
+                yield from self.iter_records()
+                return
+            offset = 0
+            for line in f:
+                line_offset, offset = offset, offset + len(line)
+                if line_offset >= end:
+                    break
+                if line_offset in live_offsets:
+                    yield json.loads(line)
+
+    def _rewrite(self, records):
+        # 임시 파일에 기록 후 교체하여 중단되어도 기존 파일이 손상되지 않도록 함
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.path}.tmp"
+        keys = set()
+        with open(temp_path, "wb") as f:
+            for record in records:
+                key = _record_key(record)
+                if key not in keys:
+                    keys.add(key)
+                    f.write((_encode(record) + "\n").encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._index = None  # 다음 사용 시 새 파일로 인덱스를 다시 만듦
+
+    def replace(self, records):
+        """저장소 전체를 records로 교체."""
+        with self._lock:
+            self._rewrite(records)
+            self._sync()
+
+    def compact(self):
+        """무효 줄을 제거하여 유효 레코드만 다시 기록."""
+        with self._lock:
+            self._sync()
+            if self._dead:
+                self._rewrite(self.iter_records())  # 이전 파일에서 한 줄씩 읽어 임시 파일에 기록
+                self._sync()
+
+    def _maybe_compact(self):
+        if self._dead >= self.compact_min_dead and self._dead > len(self._index):
+            self.compact()
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(path=JSONL_FILE, legacy_path=JSON_FILE):
+    """경로별로 하나의 JsonRecordStore를 반환 (인덱스를 재사용)."""
+    with _stores_lock:
+        store = _stores.get(path)
+        if store is None:
+            store = _stores[path] = JsonRecordStore(path, legacy_path)
+        return store
 
-JSON_FILE = "config/Location_Info.json"
 
 def save_json(new_data):
     # 저장 시 튜플을 리스트로 변환
-    with open(JSON_FILE, "w") as f:
-        json.dump(new_data, f, indent=4)
-    print(f"{JSON_FILE}에 데이터가 저장되었습니다.")
-
-def load_json():
-    try:
-        with open(JSON_FILE, "r") as f:
-            return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
-        return []
-    
-def append_json(new_data):
-    try:
-        with open(JSON_FILE, "r") as f:
-            data = json.load(f)
-            # 기존 데이터 리스트를 튜플 리스트로 변환
-    except (FileNotFoundError, json.JSONDecodeError):
-        data = []
-    
-    # 새로운 데이터 추가 (중복 방지)
-    if new_data not in data:
-        data.append(new_data)
+    # 리스트(배열)가 아닌 값은 레코드 하나로 저장 (이전 형식 변환과 같은 방식)
+    store = get_store()
+    store.replace(new_data if isinstance(new_data, (list, tuple)) else [new_data])
+    print(f"{store.path}에 데이터가 저장되었습니다.")
 
-    # 저장 시 튜플을 리스트로 변환
-    with open(JSON_FILE, "w") as f:
-        json.dump(new_data, f, indent=4)
-    print(f"{JSON_FILE}에 데이터가 저장되었습니다.")
\ No newline at end of file
+def load_json(predicate=None, limit=None):
+    """
+    저장된 레코드를 하나씩 반환하는 이터레이터 (목록이 필요하면 list(load_json())).
+    - predicate: 지정 시 True를 반환한 레코드만 반환
+    - limit: 반환할 최대 개수 (도달하면 나머지는 읽지 않음)
+    """
+    return _filtered(get_store().iter_records(), predicate, limit)
+
+def find_json(predicate):
+    """predicate를 만족하는 첫 레코드를 반환 (없으면 None)."""
+    return next(load_json(predicate, limit=1), None)
+
+def append_json(new_data):
+    # 새로운 데이터 추가 (중복 방지, 파일 끝에 한 줄만 기록)
+    store = get_store()
+    if store.append(new_data):
+        print(f"{store.path}에 데이터가 저장되었습니다.")
@@ -0,0 +1,181 @@
+import io
+import shutil
+from PIL import Image
+
+PDF_HEADER = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n"
+COLOR_SPACES = {"RGB": "/DeviceRGB", "L": "/DeviceGray"}  # JPEG을 그대로 넣을 수 있는 모드
+
+TRAILER_TAIL_SIZE = 64  # startxref 위치를 찾기 위해 읽을 파일 끝 바이트 수
+
+
+def read_startxref(path):
+    """
+    PDF 끝의 "startxref\n<위치>\n%%EOF"에서 마지막 xref 위치를 반환.
+    - 형식이 다르거나 읽을 수 없으면 None
+    """
+    try:
+        with open(path, "rb") as f:
+            size = f.seek(0, io.SEEK_END)
+            f.seek(max(0, size - TRAILER_TAIL_SIZE))
+            tail = f.read()
+    except OSError:
+        return None
+    lines = tail.rstrip(b"\r\n").splitlines()
+    if len(lines) < 3 or lines[-1] != b"%%EOF" or lines[-3] != b"startxref" or not lines[-2].isdigit():
+        return None
+    return int(lines[-2])
+
+
+class StreamingPDFWriter:
+    """
+    이미지를 한 장씩 페이지로 기록하는 PDF writer.
+    - 페이지마다 이미지·콘텐츠·페이지 객체를 바로 파일에 기록하므로 메모리에는 이미지 한 장만 유지
+    - RGB/흑백 JPEG은 디코딩 없이 원본 바이트를 그대로 넣음 (DCTDecode)
+    - 그 외 이미지는 한 장씩 디코딩하여 RGB JPEG으로 인코딩 (Pillow의 PDF 저장과 같은 방식)
+    - 페이지 크기는 resolution(dpi) 기준 (기본 72dpi: 1픽셀 = 1pt, Pillow 기본값과 동일)
+    - state를 넘기면 기존 PDF에 페이지를 증분 업데이트로 추가
+    """
+    def __init__(self, output_pdf, resolution=72.0, quality=75, state=None):
+        """
+        - state: 이전에 이 writer로 만든 PDF의 state. 지정 시 기존 파일 끝에 새 페이지를
+          증분 업데이트(incremental update)로 추가 (기존 페이지는 다시 쓰지 않음)
+        """
+        self.output_pdf = output_pdf
+        self.resolution = resolution
+        self.quality = quality
+        self.offsets = {}  # 이번에 기록한 객체 번호 -> 파일 내 위치
+        if state is None:
+            self.file = open(output_pdf, "wb")
+            self.file.write(PDF_HEADER)
+            self.page_refs = []
+            self.next_object = 3  # 1: Catalog, 2: Pages (close 시 기록)
+            self.previous_xref = None
+            self._write_object(1, b"<< /Type /Catalog /Pages 2 0 R >>")
+        else:
+            self.file = open(output_pdf, "r+b")
+            self.file.seek(0, io.SEEK_END)
+            self.page_refs = list(state["page_refs"])
+            self.next_object = state["next_object"]
+            self.previous_xref = state["xref_offset"]
+        self.xref_offset = None
+
+    @property
+    def state(self):
+        """증분 추가에 필요한 정보 (close 이후 유효)."""
+        return {"page_refs": self.page_refs, "next_object": self.next_object, "xref_offset": self.xref_offset}
+
+    def __enter__(self) -> "StreamingPDFWriter":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback_obj) -> bool:
+        self.close()
+        return False
+
+    def _allocate(self, count):
+        start = self.next_object
+        self.next_object += count
+        return range(start, start + count)
+
+    def _write_object(self, number, body):
+        self.offsets[number] = self.file.tell()
+        self.file.write(b"%d 0 obj\n" % number + body + b"\nendobj\n")
+
+    def _write_stream_object(self, number, dictionary, length, write_data):
+        self.offsets[number] = self.file.tell()
+        self.file.write(b"%d 0 obj\n<< " % number + dictionary + b" /Length %d >>\nstream\n" % length)
+        write_data(self.file)
+        self.file.write(b"\nendstream\nendobj\n")
+
+    def add_image(self, file_path):
+        """
+        이미지 파일 하나를 새 페이지로 추가.
+        - 열거나 디코딩할 수 없는 이미지는 예외를 그대로 전달하고, 파일과 객체 번호는 추가 전 상태로 되돌림
+          (이후 close()는 그때까지 추가한 페이지로 올바른 PDF를 만듦)
+        """
+        start = self.file.tell()
+        next_object = self.next_object
+        try:
+            self._add_image(file_path)
+        except BaseException:
+            for number in range(next_object, self.next_object):
+                self.offsets.pop(number, None)
+            self.next_object = next_object
+            self.file.seek(start)
+            self.file.truncate()
+            raise
+
+    def _add_image(self, file_path):
+        with Image.open(file_path) as img:
+            width, height = img.size
+            if img.format == "JPEG" and img.mode in COLOR_SPACES:
+                # 원본 JPEG 바이트를 그대로 복사 (디코딩/재인코딩 없음)
+                color_space = COLOR_SPACES[img.mode]
+                length = img.fp.seek(0, io.SEEK_END)
+                img.fp.seek(0)
+                write_data = lambda output: shutil.copyfileobj(img.fp, output, 1024 * 1024)
+            else:
+                if img.mode != "RGB":  # 이미지가 RGB 모드가 아닐 경우 변환
+                    converted = img.convert("RGB")
+                else:
+                    converted = img
+                color_space = COLOR_SPACES["RGB"]
+                buffer = io.BytesIO()
+                converted.save(buffer, "JPEG", quality=self.quality)
+                converted.close()
+                encoded = buffer.getbuffer()
+                length = len(encoded)
+                write_data = lambda output: output.write(encoded)
+
+            # 이미지를 열고 인코딩한 뒤에 객체 번호를 할당
+            image_number, content_number, page_number = self._allocate(3)
+            self._write_stream_object(
+                image_number,
+                b"/Type /XObject /Subtype /Image /Width %d /Height %d /ColorSpace %s "
+                b"/BitsPerComponent 8 /Filter /DCTDecode" % (width, height, color_space.encode()),
+                length, write_data
+            )
+
+        page_width = width * 72.0 / self.resolution
+        page_height = height * 72.0 / self.resolution
+        content = b"q %.2f 0 0 %.2f 0 0 cm /image Do Q" % (page_width, page_height)
+        self._write_stream_object(content_number, b"", len(content), lambda output: output.write(content))
+        self._write_object(
+            page_number,
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %.2f %.2f] "
+            b"/Resources << /XObject << /image %d 0 R >> /ProcSet [/PDF /ImageC /ImageB] >> "
+            b"/Contents %d 0 R >>" % (page_width, page_height, image_number, content_number)
+        )
+        self.page_refs.append(page_number)
+
+    def close(self):
+        """페이지 트리, xref 테이블, trailer를 기록하고 파일을 닫음."""
+        if self.file.closed:
+            return
+        kids = b" ".join(b"%d 0 R" % number for number in self.page_refs)
+        self._write_object(2, b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(self.page_refs)))
+
+        self.xref_offset = self.file.tell()
+        self.file.write(b"xref\n")
+        if self.previous_xref is None:
+            self.file.write(b"0 %d\n0000000000 65535 f \n" % self.next_object)
+            for number in range(1, self.next_object):
+                self.file.write(b"%010d 00000 n \n" % self.offsets[number])
+            previous = b""
+        else:
+            # 증분 업데이트: 0번(free) 항목과 이번에 기록한 객체만 연속 구간별로 기록
+            self.file.write(b"0 1\n0000000000 65535 f \n")
+            numbers = sorted(self.offsets)
+            start = 0
+            for index in range(1, len(numbers) + 1):
+                if index == len(numbers) or numbers[index] != numbers[index - 1] + 1:
+                    self.file.write(b"%d %d\n" % (numbers[start], index - start))
+                    for number in numbers[start:index]:
+                        self.file.write(b"%010d 00000 n \n" % self.offsets[number])
+                    start = index
+            previous = b" /Prev %d" % self.previous_xref
+        self.file.write(
+            b"trailer\n<< /Size %d /Root 1 0 R%s >>\nstartxref\n%d\n%%%%EOF\n"
+            % (self.next_object, previous, self.xref_offset)
+        )
+        self.file.truncate()
+        self.file.close()
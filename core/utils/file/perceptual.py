@@ -0,0 +1,163 @@
+from functools import lru_cache
+from PIL import Image, UnidentifiedImageError
+from core.utils.file.hashing import hash_files
+from core.utils.file.walker import iter_files
+
+try:
+    import numpy as np  # 선택 의존성: 지각 해시(perceptual hash) 사용 시에만 필요
+except ImportError:
+    np = None
+
+image_extensions = (".jpg", ".jpeg", ".png", ".bmp", ".gif")  # 지각 해시 대상 확장자
+
+
+def _require_numpy():
+    if np is None:
+        raise ImportError("numpy is required for perceptual duplicate detection.")
+
+
+def _grayscale(file_path, width, height):
+    """이미지를 흑백으로 축소한 float32 배열을 반환."""
+    with Image.open(file_path) as img:
+        img.draft("L", (width * 4, height * 4))  # JPEG은 축소된 크기로 디코딩하여 비용 절감
+        return np.asarray(img.convert("L").resize((width, height), Image.BILINEAR), dtype=np.float32)
+
+
+def _to_hex(bits):
+    return np.packbits(bits.ravel()).tobytes().hex()
+
+
+@lru_cache(maxsize=8)
+def _dct_matrix(size):
+    # DCT-II 변환 행렬 (scipy 없이 행렬 곱으로 2차원 DCT 계산)
+    k = np.arange(size)[:, None]
+    n = np.arange(size)[None, :]
+    return np.cos(np.pi * (2 * n + 1) * k / (2 * size)).astype(np.float32)
+
+
+def dhash(file_path, hash_size=8):
+    """인접 픽셀 밝기 차이 기반 해시 (difference hash)."""
+    pixels = _grayscale(file_path, hash_size + 1, hash_size)
+    return _to_hex(pixels[:, 1:] > pixels[:, :-1])
+
+
+def phash(file_path, hash_size=8, highfreq_factor=4):
+    """저주파 DCT 계수 기반 해시 (perceptual hash)."""
+    size = hash_size * highfreq_factor
+    matrix = _dct_matrix(size)
+    coefficients = (matrix @ _grayscale(file_path, size, size) @ matrix.T)[:hash_size, :hash_size]
+    return _to_hex(coefficients > np.median(coefficients))
+
+
+HASH_FUNCTIONS = {"dhash": dhash, "phash": phash}
+
+
+def image_hash(file_path, algorithm="dhash", hash_size=8):
+    """지각 해시를 16진수 문자열로 반환. 이미지로 열 수 없는 파일은 None."""
+    try:
+        return HASH_FUNCTIONS[algorithm](file_path, hash_size)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        return None
+
+
+def hamming_distance(a, b):
+    return bin(a ^ b).count("1")
+
+
+class BKTree:
+    """
+    해밍 거리 기반 BK-tree.
+    - 삼각 부등식으로 거리 범위 밖의 하위 트리를 건너뛰어 전체 비교 없이 임계값 이내 항목을 찾음
+    """
+    def __init__(self, distance=hamming_distance):
+        self.distance = distance
+        self.root = None  # [key, item, {거리: 자식 노드}]
+        self.size = 0
+
+    def add(self, key, item):
+        self.size += 1
+        if self.root is None:
+            self.root = [key, item, {}]
+            return
+        node = self.root
+        while True:
+            distance = self.distance(key, node[0])
+            child = node[2].get(distance)
+            if child is None:
+                node[2][distance] = [key, item, {}]
+                return
+            node = child
+
+    def query(self, key, threshold):
+        """key와의 거리가 threshold 이하인 (거리, item) 목록을 반환."""
+        results = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            distance = self.distance(key, node[0])
+            if distance <= threshold:
+                results.append((distance, node[1]))
+            for child_distance, child in node[2].items():
+                if distance - threshold <= child_distance <= distance + threshold:
+                    stack.append(child)
+        return results
+
+
+def find_similar_images(folder_path, threshold=5, algorithm="dhash", hash_size=8, workers=None, cache=None, exclude=()):
+    """
+    지각 해시가 비슷한(해밍 거리 threshold 이하) 이미지 그룹을 찾음.
+    - 반환: [(기준 이미지 경로, [(비슷한 이미지 경로, 거리), ...]), ...]
+    - 탐색 순서대로 가장 가까운 기준 이미지에 묶고, 그룹마다 해상도가 가장 큰 이미지를 기준으로 반환
+    - 반환되는 비슷한 이미지는 모두 기준 이미지와의 거리가 threshold 이하
+    - cache: HashCache (지정 시 변경되지 않은 이미지는 저장된 해시를 재사용)
+    - exclude: 탐색하지 않을 폴더 경로 목록
+    """
+    _require_numpy()
+    stats = dict(iter_files(folder_path, image_extensions, exclude))
+    if cache is None:
+        digests = hash_files(stats, image_hash, workers, algorithm=algorithm, hash_size=hash_size)
+    else:
+        digests = cache.hash_files(stats, stats, image_hash, f"perceptual-{hash_size}", workers, algorithm, hash_size=hash_size)
+
+    tree = BKTree()
+    groups = {}
+    for file_path in stats:
+        digest = digests[file_path]
+        if digest is None:
+            continue
+        value = int(digest, 16)
+        matches = tree.query(value, threshold)
+        if matches:
+            groups[min(matches, key=lambda match: match[0])[1]].append(file_path)
+        else:
+            tree.add(value, file_path)
+            groups[file_path] = [file_path]
+
+    # 그룹마다 해상도가 가장 큰 이미지(원본일 가능성이 높은 이미지)를 남길 기준으로 선택
+    similar_groups = []
+    for group in groups.values():
+        if len(group) < 2:
+            continue
+        keeper = max(group, key=_pixel_count)
+        keeper_value = int(digests[keeper], 16)
+        # 그룹 구성원끼리는 최대 2 * threshold까지 떨어질 수 있으므로 새 기준과 다시 비교하여
+        # threshold 밖의 이미지는 남겨 둠
+        similar = []
+        for file_path in group:
+            if file_path == keeper:
+                continue
+            distance = hamming_distance(keeper_value, int(digests[file_path], 16))
+            if distance <= threshold:
+                similar.append((file_path, distance))
+        if similar:
+            similar_groups.append((keeper, similar))
+    return similar_groups
+
+
+def _pixel_count(file_path):
+    # 헤더만 읽어 해상도를 확인 (디코딩하지 않음)
+    try:
+        with Image.open(file_path) as img:
+            return img.width * img.height
+    except (OSError, UnidentifiedImageError):
+        return 0
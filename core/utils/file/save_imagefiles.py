@@ -1,60 +1,158 @@
 import os
+import json
 from PIL import Image
-from pptx import Presentation
-from pptx.util import Inches, Pt  
+from core.utils.file.pdf_writer import StreamingPDFWriter, read_startxref
+from core.utils.file.image_prescale import prescale_images
+from core.utils.file.image_files import scan_images
 
-def load_image_files(image_folder):
-    """ 폴더 내 모든 이미지 파일을 screenshot_XXX 순서대로 정렬하여 반환 """
-    image_files = [
-        os.path.join(image_folder, file)
-        for file in os.listdir(image_folder)
-        if file.lower().endswith(('.png', '.jpg', '.jpeg', '.bmp', '.gif'))
-    ]
+def load_image_files(image_folder, recursive=False):
+    """
+    폴더 내 모든 이미지 파일을 자연 정렬 순서(screenshot_2 → screenshot_10)로 정렬하여 경로 목록으로 반환.
+    - recursive: True이면 하위 폴더까지 포함 (숨김 폴더 제외)
+    - 폴더 mtime이 그대로이면 이전 탐색 결과를 재사용 (image_files.scan_images 참고)
+    """
+    return [info.path for info in scan_images(image_folder, recursive)]
 
-    # 숫자 기준 정렬 (screenshot_XXX.png → XXX 기준)
-    image_files.sort(key=lambda x: int(os.path.basename(x).split('_')[1].split('.')[0]))
 
-    return image_files
+def _manifest_path(output_file):
+    return f"{output_file}.manifest.json"
 
+def _file_entry(image_folder, file_path):
+    stat_result = os.stat(file_path)
+    return {"path": os.path.relpath(file_path, image_folder), "size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns}
 
-def PPTsave(image_folder, output_file="output.pptx"):
-    # PowerPoint 생성
-    presentation = Presentation()
+def _load_manifest(output_file):
+    try:
+        with open(_manifest_path(output_file), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
 
-    image_files = load_image_files(image_folder)
+def _output_entry(output_file):
+    stat_result = os.stat(output_file)
+    return {"size": stat_result.st_size, "mtime_ns": stat_result.st_mtime_ns}
 
-    presentation.slide_width = Inches(13.33)  # 가로 크기
-    presentation.slide_height = Inches(7.5)   # 세로 크기
+def _save_manifest(output_file, entries, options, incremental, state=None):
+    # 증분 모드에서만 기록하고, 전체 생성 시에는 이전 manifest를 삭제 (출력 파일과 맞지 않게 되므로)
+    path = _manifest_path(output_file)
+    if not incremental:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    # 임시 파일에 기록 후 교체
+    manifest = {"options": options, "files": entries, "state": state, "output": _output_entry(output_file)}
+    with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+    os.replace(f"{path}.tmp", path)
+
+def _plan_export(image_folder, image_files, output_file, options, incremental, output_check=None):
+    """
+    내보낼 파일 목록과 증분 여부를 결정.
+    - 반환: (전체 파일 항목, 새로 추가할 파일 목록, 기존 manifest 또는 None)
+    - 기존 manifest의 파일들이 현재 목록의 앞부분과 (경로, 크기, 수정 시각, 순서)까지 같고
+      옵션이 같을 때만 증분 추가, 그 외에는 전체를 다시 생성 (manifest None 반환)
+    - 출력 파일의 크기·수정 시각이 manifest 기록과 다르면(외부에서 수정·재생성) 전체를 다시 생성
+    - output_check: (출력 파일, manifest)를 받아 출력 파일이 그대로인지 추가로 확인하는 함수 (예: PDF xref 위치)
+    """
+    entries = [_file_entry(image_folder, file) for file in image_files]
+    manifest = _load_manifest(output_file) if incremental and os.path.exists(output_file) else None
+    if manifest and (manifest.get("output") != _output_entry(output_file)
+                     or (output_check is not None and not output_check(output_file, manifest))):
+        print(f"[INFO] {output_file} changed since the last export; rebuilding it.")
+        manifest = None
+    if manifest and manifest.get("options") == options:
+        exported = manifest.get("files", [])
+        if entries[:len(exported)] == exported:
+            return entries, image_files[len(exported):], manifest
+    return entries, image_files, None
+
+
+def PPTsave(image_folder, output_file="output.pptx", prescale=True, dpi=144, quality=85, cache_dir=None,
+            workers=None, incremental=False, recursive=False):
+    """
+    폴더의 이미지를 한 장씩 슬라이드로 만들어 PPT로 저장.
+    - prescale: True이면 이미지를 슬라이드 픽셀 크기(슬라이드 크기 x dpi)로 미리 축소·재인코딩하여 삽입
+    - quality: 미리 축소한 JPEG 품질
+    - cache_dir: 축소한 이미지 캐시 폴더 (기본: image_folder/.prescale_cache)
+    - workers: 축소 작업 프로세스 수
+    - incremental: True이면 이전에 내보낸 파일(output_file.manifest.json) 이후 새 이미지만 슬라이드로 추가
+    - recursive: True이면 하위 폴더의 이미지도 포함
+    """
+    from pptx import Presentation  # PDF 저장만 할 때는 python-pptx를 불러오지 않도록 함수 안에서 import
+    from pptx.util import Inches
+
+    image_files = load_image_files(image_folder, recursive)
+    options = {"prescale": prescale, "dpi": dpi, "quality": quality}
+    entries, new_files, manifest = _plan_export(image_folder, image_files, output_file, options, incremental)
+
+    if manifest is not None and not new_files:
+        print(f"[INFO] PPT file is already up to date: {output_file}")
+        return
+
+    if manifest is not None:
+        # 기존 PPT를 열어 새 슬라이드만 추가
+        presentation = Presentation(output_file)
+    else:
+        # PowerPoint 생성
+        presentation = Presentation()
+        presentation.slide_width = Inches(13.33)  # 가로 크기
+        presentation.slide_height = Inches(7.5)   # 세로 크기
+
+    # 슬라이드 크기 가져오기
+    slide_width = presentation.slide_width
+    slide_height = presentation.slide_height
+
+    if prescale:
+        slide_pixels = (round(slide_width.inches * dpi), round(slide_height.inches * dpi))
+        new_files = prescale_images(new_files, slide_pixels, quality, cache_dir, workers)
 
     # 이미지 파일을 슬라이드에 추가
-    for image in image_files:
+    for image in new_files:
         slide = presentation.slides.add_slide(presentation.slide_layouts[6])  # 빈 슬라이드
         
-        # 슬라이드 크기 가져오기
-        slide_width = presentation.slide_width
-        slide_height = presentation.slide_height
-        
         # 이미지 추가 (슬라이드 전체를 채우도록)
         slide.shapes.add_picture(image, 0, 0, width=slide_width, height=slide_height)
 
     # 결과 저장
     presentation.save(output_file)
-    print(f"[INFO] PPT file has been saved: {output_file}")
-
-def PDFsave(image_folder, output_pdf="output.pdf"):
-    image_files = load_image_files(image_folder)
-
-    # 이미지 로드 및 변환
-    images = []
-    for file in image_files:
-        img = Image.open(file)
-        if img.mode != "RGB":  # 이미지가 RGB 모드가 아닐 경우 변환
-            img = img.convert("RGB")
-        images.append(img)
-
-    # PDF 생성
-    if images:
-        images[0].save(output_pdf, save_all=True, append_images=images[1:])
-        print(f"[INFO] PDF creation complete : {output_pdf}")
-    else:
-        print("[DEBUG] There are no images to convert to PDF.")
\ No newline at end of file
+    _save_manifest(output_file, entries, options, incremental)
+    print(f"[INFO] PPT file has been saved: {output_file} ({len(new_files)} slides added)")
+
+def _pdf_matches_state(output_pdf, manifest):
+    # 파일 끝 startxref 위치가 manifest의 state와 같을 때만 그 뒤에 증분 업데이트를 추가
+    state = manifest.get("state") or {}
+    return state.get("xref_offset") is not None and read_startxref(output_pdf) == state["xref_offset"]
+
+def PDFsave(image_folder, output_pdf="output.pdf", incremental=False, recursive=False):
+    """
+    폴더의 이미지를 한 장씩 페이지로 만들어 PDF로 저장.
+    - incremental: True이면 이전에 내보낸 파일(output_pdf.manifest.json) 이후 새 이미지만
+      기존 PDF 끝에 증분 업데이트로 추가 (기존 페이지는 다시 쓰지 않음)
+    - recursive: True이면 하위 폴더의 이미지도 포함
+    """
+    image_files = load_image_files(image_folder, recursive)
+
+    if not image_files:
+        print("[DEBUG] There are no images to convert to PDF.")
+        return
+
+    options = {"resolution": 72.0}
+    entries, new_files, manifest = _plan_export(image_folder, image_files, output_pdf, options, incremental,
+                                                _pdf_matches_state)
+    state = manifest.get("state") if manifest else None
+    if manifest is not None and not new_files:
+        print(f"[INFO] PDF is already up to date : {output_pdf}")
+        return
+
+    # 이미지를 한 장씩 페이지로 기록 (메모리에는 이미지 한 장만 유지, JPEG은 재인코딩 없이 포함)
+    added = 0
+    with StreamingPDFWriter(output_pdf, options["resolution"], state=state) as writer:
+        for file in new_files:
+            try:
+                writer.add_image(file)
+                added += 1
+            except (OSError, Image.DecompressionBombError) as e:
+                # 손상되었거나 읽을 수 없는 이미지는 건너뜀 (writer는 추가 전 상태로 되돌아감)
+                print(f"[ERROR] Skipping unreadable image: {file} ({e})")
+    _save_manifest(output_pdf, entries, options, incremental, writer.state)
+    print(f"[INFO] PDF creation complete : {output_pdf} ({added} pages added)")
@@ -0,0 +1,136 @@
+import os
+import time
+import threading
+
+CHECK_INTERVAL = 1.0  # 파일 변경 확인(stat) 최소 간격 (초)
+POLL_INTERVAL = 2.0  # 변경 감시 스레드의 확인 간격 (초)
+
+
+class SettingsFile:
+    """
+    설정 파일 하나의 파싱 결과 캐시.
+    - 파일의 mtime_ns 또는 크기가 바뀌었을 때만 다시 파싱
+    - 변경 확인(stat)은 check_interval초에 한 번만 하므로 그 사이의 조회는 I/O 없이 캐시를 반환
+    - 다시 파싱하여 값이 바뀌면 등록된 콜백(path, 새 값)을 호출
+    """
+    def __init__(self, path, parser, check_interval=CHECK_INTERVAL):
+        """
+        - parser: 파일 경로를 받아 파싱 결과를 반환하는 함수 (파일이 없으면 호출하지 않고 {} 사용)
+        """
+        self.path = path
+        self.parser = parser
+        self.check_interval = check_interval
+        self.callbacks = []
+        self._lock = threading.Lock()
+        self._signature = None  # (mtime_ns, size), 파일이 없으면 (None, None)
+        self._value = None
+        self._checked_at = None
+
+    def _stat_signature(self):
+        try:
+            stat_result = os.stat(self.path)
+        except FileNotFoundError:
+            return None, None
+        return stat_result.st_mtime_ns, stat_result.st_size
+
+    def get(self, force_check=False):
+        """캐시된 파싱 결과를 반환 (필요할 때만 파일을 다시 읽음)."""
+        now = time.monotonic()
+        changed = False
+        with self._lock:
+            if (force_check or self._checked_at is None
+                    or now - self._checked_at >= self.check_interval):
+                self._checked_at = now
+                signature = self._stat_signature()
+                if signature != self._signature:
+                    value = {} if signature == (None, None) else self.parser(self.path)
+                    changed = self._signature is not None and value != self._value
+                    self._signature, self._value = signature, value
+            value = self._value
+        if changed:
+            for callback in list(self.callbacks):
+                callback(self.path, value)
+        return value
+
+    def invalidate(self):
+        """다음 조회 시 변경 여부를 바로 확인하도록 함 (파일을 직접 수정한 뒤 호출)."""
+        with self._lock:
+            self._checked_at = None
+
+
+class SettingsService:
+    """
+    설정 파일(YAML, .env 등)을 경로별로 한 번만 파싱하여 캐시하는 서비스.
+    - get(path, parser)로 조회, watch(path, parser, callback)로 변경 시 콜백 호출 (핫 리로드)
+    - watch 등록 시 감시 스레드(daemon)가 poll_interval초마다 변경 여부를 확인
+    """
+    def __init__(self, check_interval=CHECK_INTERVAL, poll_interval=POLL_INTERVAL):
+        self.check_interval = check_interval
+        self.poll_interval = poll_interval
+        self._files = {}  # {(절대 경로, parser): SettingsFile}
+        self._lock = threading.Lock()
+        self._watched = set()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def file(self, path, parser):
+        key = (os.path.abspath(path), parser)
+        with self._lock:
+            settings_file = self._files.get(key)
+            if settings_file is None:
+                settings_file = self._files[key] = SettingsFile(path, parser, self.check_interval)
+            return settings_file
+
+    def get(self, path, parser):
+        return self.file(path, parser).get()
+
+    def invalidate(self, path):
+        """path의 모든 캐시 항목이 다음 조회 시 변경 여부를 확인하도록 함."""
+        path = os.path.abspath(path)
+        with self._lock:
+            files = [settings_file for (file_path, _), settings_file in self._files.items() if file_path == path]
+        for settings_file in files:
+            settings_file.invalidate()
+
+    def watch(self, path, parser, callback):
+        """path가 바뀌면 callback(path, 새 값)을 호출하도록 등록하고 현재 값을 반환."""
+        settings_file = self.file(path, parser)
+        settings_file.callbacks.append(callback)
+        value = settings_file.get()
+        with self._lock:
+            self._watched.add(settings_file)
+            if self._thread is None:
+                self._stop_event.clear()
+                self._thread = threading.Thread(target=self._poll, name="SettingsWatcher", daemon=True)
+                self._thread.start()
+        return value
+
+    def unwatch(self, path, callback):
+        path = os.path.abspath(path)
+        with self._lock:
+            for settings_file in list(self._watched):
+                if os.path.abspath(settings_file.path) == path and callback in settings_file.callbacks:
+                    settings_file.callbacks.remove(callback)
+                    if not settings_file.callbacks:
+                        self._watched.discard(settings_file)
+
+    def _poll(self):
+        while not self._stop_event.wait(self.poll_interval):
+            with self._lock:
+                watched = list(self._watched)
+            for settings_file in watched:
+                try:
+                    settings_file.get(force_check=True)
+                except Exception as e:
+                    print(f"[ERROR] Failed to reload {settings_file.path}: {e}")
+
+    def stop(self):
+        """감시 스레드를 종료."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop_event.set()
+            thread.join()
+
+
+settings = SettingsService()
@@ -0,0 +1,165 @@
+import os, json, atexit, bisect, threading
+from time import perf_counter
+from functools import wraps
+
+METRICS_ENV = "EVERY_CRAWLER_METRICS"  # 설정 시 해당 경로로 종료 시점에 지표를 저장
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)  # 초 단위
+
+
+class FunctionMetrics:
+    """함수 하나의 호출 수, 예외 수, 지연 시간 히스토그램."""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.calls = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.exceptions = {}  # 예외 타입 이름 -> 횟수
+
+    def observe(self, elapsed, exception=None):
+        self.calls += 1
+        self.total_seconds += elapsed
+        self.max_seconds = max(self.max_seconds, elapsed)
+        self.bucket_counts[bisect.bisect_left(self.buckets, elapsed)] += 1
+        if exception is not None:
+            name = type(exception).__name__
+            self.exceptions[name] = self.exceptions.get(name, 0) + 1
+
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": sum(self.exceptions.values()),
+            "exceptions": dict(self.exceptions),
+            "total_seconds": self.total_seconds,
+            "mean_seconds": self.total_seconds / self.calls if self.calls else 0.0,
+            "max_seconds": self.max_seconds,
+            "buckets": {
+                **{str(bound): count for bound, count in zip(self.buckets, self.bucket_counts)},
+                "+Inf": self.bucket_counts[-1],
+            },
+        }
+
+
+class MetricsRegistry:
+    """
+    instrument 데코레이터로 감싼 함수들의 지표 저장소.
+    - enabled가 False이면 데코레이터는 원래 함수를 그대로 호출 (측정 비용 없음)
+    """
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.enabled = False
+        self.buckets = buckets
+        self._metrics = {}
+        self._lock = threading.Lock()
+        self._output_path = None
+
+    def enable(self, output_path=None):
+        """
+        측정 시작.
+        - output_path: 지정 시 프로세스 종료 시점에 저장 (.prom 확장자는 Prometheus 텍스트, 그 외 JSON)
+        """
+        self.enabled = True
+        if output_path and self._output_path is None:
+            atexit.register(self._dump_at_exit)
+        self._output_path = output_path or self._output_path
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._metrics.clear()
+
+    def record(self, name, elapsed, exception=None):
+        with self._lock:
+            metrics = self._metrics.get(name)
+            if metrics is None:
+                metrics = self._metrics[name] = FunctionMetrics(self.buckets)
+            metrics.observe(elapsed, exception)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: metrics.to_dict() for name, metrics in sorted(self._metrics.items())}
+
+    def dump_json(self, path):
+        _ensure_directory(path)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.snapshot(), f, indent=4, ensure_ascii=False)
+
+    def dump_prometheus(self, path):
+        _ensure_directory(path)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+
+    def dump(self, path):
+        if path.endswith(".prom"):
+            self.dump_prometheus(path)
+        else:
+            self.dump_json(path)
+
+    def to_prometheus(self):
+        """Prometheus text exposition 형식으로 변환."""
+        lines = [
+            "# HELP every_crawler_function_latency_seconds Wall-clock latency of instrumented functions.",
+            "# TYPE every_crawler_function_latency_seconds histogram",
+        ]
+        snapshot = self.snapshot()
+        for name, metrics in snapshot.items():
+            cumulative = 0
+            for bound, count in metrics["buckets"].items():
+                cumulative += count
+                lines.append(f'every_crawler_function_latency_seconds_bucket{{function="{name}",le="{bound}"}} {cumulative}')
+            lines.append(f'every_crawler_function_latency_seconds_sum{{function="{name}"}} {metrics["total_seconds"]}')
+            lines.append(f'every_crawler_function_latency_seconds_count{{function="{name}"}} {metrics["calls"]}')
+
+        lines.append("# HELP every_crawler_function_exceptions_total Exceptions raised by instrumented functions.")
+        lines.append("# TYPE every_crawler_function_exceptions_total counter")
+        for name, metrics in snapshot.items():
+            for exception, count in sorted(metrics["exceptions"].items()):
+                lines.append(f'every_crawler_function_exceptions_total{{function="{name}",exception="{exception}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    def _dump_at_exit(self):
+        if self._output_path:
+            try:
+                self.dump(self._output_path)
+            except Exception as e:
+                print(f"[Debug] Failed to write metrics to {self._output_path}: {e}")
+
+
+def _ensure_directory(path):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+
+registry = MetricsRegistry()
+
+if os.environ.get(METRICS_ENV):
+    registry.enable(os.environ[METRICS_ENV])
+
+
+def instrument(func=None, *, name=None, metrics=registry):
+    """
+    함수의 호출 수와 지연 시간을 registry에 기록하는 데코레이터.
+    - 예외는 타입별로 따로 집계한 뒤 그대로 다시 발생시킴
+    - exception_handler와 함께 쓸 때는 안쪽에 두어야 원래 예외가 집계됨
+    """
+    if func is None:
+        return lambda f: instrument(f, name=name, metrics=metrics)
+
+    metric_name = name or f"{func.__module__}.{func.__qualname__}"
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not metrics.enabled:
+            return func(*args, **kwargs)
+        start = perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            metrics.record(metric_name, perf_counter() - start, e)
+            raise
+        metrics.record(metric_name, perf_counter() - start)
+        return result
+
+    return wrapper
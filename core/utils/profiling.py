@@ -0,0 +1,168 @@
+import os
+import io
+import re
+import time
+import pstats
+import cProfile
+import tracemalloc
+from contextlib import contextmanager
+
+PROFILE_DIR = "profiles"  # 기본 결과 폴더: profiles/<시각>_<이름>/
+CPU_STATS_FILE = "cpu.pstats"
+CPU_REPORT_FILE = "cpu_top.txt"
+MEMORY_SNAPSHOT_FILE = "memory.snapshot"
+MEMORY_REPORT_FILE = "memory_top.txt"
+
+# 측정 도구 자체와 import 시스템의 할당은 제외
+_MEMORY_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, cProfile.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+)
+
+
+def make_profile_dir(label=None, root=PROFILE_DIR):
+    """root 아래에 <YYYYmmdd-HHMMSS>_<label> 폴더를 만들어 경로를 반환."""
+    name = time.strftime("%Y%m%d-%H%M%S")
+    if label:
+        name = f"{name}_{label}"
+    path = os.path.join(root, name)
+    suffix = 1
+    while os.path.exists(path):  # 같은 초에 여러 번 실행한 경우
+        suffix += 1
+        path = os.path.join(root, f"{name}-{suffix}")
+    os.makedirs(path)
+    return path
+
+
+def _write_cpu_report(profiler, output_dir, top):
+    profiler.dump_stats(os.path.join(output_dir, CPU_STATS_FILE))
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream).strip_dirs()
+    stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(top)
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    with open(os.path.join(output_dir, CPU_REPORT_FILE), "w", encoding="utf-8") as f:
+        f.write(stream.getvalue())
+
+
+def _write_memory_report(snapshot, peak, output_dir, top):
+    snapshot.dump(os.path.join(output_dir, MEMORY_SNAPSHOT_FILE))
+    statistics = snapshot.statistics("lineno")
+    with open(os.path.join(output_dir, MEMORY_REPORT_FILE), "w", encoding="utf-8") as f:
+        f.write(f"Peak traced memory: {peak / 1024 / 1024:.1f} MiB\n")
+        f.write(f"Live at end: {sum(stat.size for stat in statistics) / 1024 / 1024:.1f} MiB\n\n")
+        for index, stat in enumerate(statistics[:top], 1):
+            f.write(f"#{index}: {stat}\n")
+            for line in stat.traceback.format()[-4:]:
+                f.write(f"    {line}\n")
+
+
+@contextmanager
+def profile_run(cpu=True, trace_malloc=False, label=None, root=PROFILE_DIR, top=30, frames=25):
+    """
+    with 블록 실행을 cProfile/tracemalloc으로 측정하고 결과를 시간별 폴더에 저장.
+    - cpu: cpu.pstats(pstats/snakeviz로 열 수 있음)와 cpu_top.txt(누적/자체 시간 상위 top개)
+    - trace_malloc: memory.snapshot(tracemalloc)과 memory_top.txt(할당 위치 상위 top개, 최대 사용량)
+    - frames: tracemalloc이 할당마다 저장할 호출 스택 깊이
+    - 예외나 sys.exit로 끝나도 결과를 저장
+    - cProfile은 메인 스레드만 측정 (비동기 로그 writer 스레드, 프로세스 풀 작업은 제외)
+    - 반환: 결과 폴더 경로
+    """
+    output_dir = make_profile_dir(label, root)
+    profiler = cProfile.Profile() if cpu else None
+    if trace_malloc:
+        tracemalloc.start(frames)
+    if profiler:
+        profiler.enable()
+    try:
+        yield output_dir
+    finally:
+        if profiler:
+            profiler.disable()
+        if trace_malloc:
+            # 보고서 작성 중의 할당이 포함되지 않도록 먼저 스냅샷을 찍고 추적 종료
+            snapshot = tracemalloc.take_snapshot().filter_traces(_MEMORY_FILTERS)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if profiler:
+            _write_cpu_report(profiler, output_dir, top)
+        if trace_malloc:
+            _write_memory_report(snapshot, peak, output_dir, top)
+        print(f"[INFO] Profile saved: {output_dir}")
+
+
+def _resolve(path, filename):
+    # 결과 폴더가 주어지면 폴더 안의 파일, 파일이 주어지면 그대로 (없으면 None)
+    candidate = os.path.join(path, filename) if os.path.isdir(path) else path
+    return candidate if os.path.isfile(candidate) and candidate.endswith(os.path.splitext(filename)[1]) else None
+
+
+_ADDRESS = re.compile(r" at 0x[0-9a-fA-F]+")
+
+
+def _function_name(function):
+    # 실행마다 달라지는 객체 주소(built-in method ... at 0x...)는 제거하여 두 결과를 같은 이름으로 비교
+    filename, lineno, name = function
+    return _ADDRESS.sub("", f"{os.path.basename(filename)}:{lineno}({name})")
+
+
+def _cumulative_by_name(path):
+    # {함수 이름: [호출 수, 누적 시간]}
+    totals = {}
+    for function, (_, calls, _, cumulative, _) in pstats.Stats(path).stats.items():
+        entry = totals.setdefault(_function_name(function), [0, 0.0])
+        entry[0] += calls
+        entry[1] += cumulative
+    return totals
+
+
+def compare_cpu(old_path, new_path, top=20):
+    """두 pstats 파일의 함수별 누적 시간 차이를 큰 순서대로 문자열로 반환."""
+    old_stats = _cumulative_by_name(old_path)
+    new_stats = _cumulative_by_name(new_path)
+    rows = []
+    for name in set(old_stats) | set(new_stats):
+        old_time = old_stats.get(name, (0, 0.0))[1]
+        calls, new_time = new_stats.get(name, (0, 0.0))
+        rows.append((new_time - old_time, old_time, new_time, calls, name))
+    rows.sort(key=lambda row: abs(row[0]), reverse=True)
+
+    lines = [f"{'delta(s)':>10} {'old(s)':>10} {'new(s)':>10} {'calls':>8}  function"]
+    for delta, old_time, new_time, calls, name in rows[:top]:
+        lines.append(f"{delta:+10.4f} {old_time:10.4f} {new_time:10.4f} {calls:8d}  {name}")
+    return "\n".join(lines)
+
+
+def compare_memory(old_path, new_path, top=20):
+    """두 tracemalloc 스냅샷의 할당 위치별 크기 차이를 큰 순서대로 문자열로 반환."""
+    old_snapshot = tracemalloc.Snapshot.load(old_path)
+    new_snapshot = tracemalloc.Snapshot.load(new_path)
+    differences = new_snapshot.compare_to(old_snapshot, "lineno")
+    total = sum(stat.size_diff for stat in differences)
+    lines = [f"Total: {total / 1024:+.1f} KiB"]
+    lines.extend(str(stat) for stat in differences[:top])
+    return "\n".join(lines)
+
+
+def compare_profiles(old, new, top=20):
+    """
+    두 프로파일 결과(폴더 또는 cpu.pstats / memory.snapshot 파일)를 비교하여 출력.
+    - 양쪽에 모두 있는 결과(CPU, 메모리)만 비교
+    """
+    compared = False
+    old_cpu, new_cpu = _resolve(old, CPU_STATS_FILE), _resolve(new, CPU_STATS_FILE)
+    if old_cpu and new_cpu:
+        print(f"== CPU (cumulative time): {old_cpu} -> {new_cpu}")
+        print(compare_cpu(old_cpu, new_cpu, top))
+        compared = True
+    old_memory, new_memory = _resolve(old, MEMORY_SNAPSHOT_FILE), _resolve(new, MEMORY_SNAPSHOT_FILE)
+    if old_memory and new_memory:
+        if compared:
+            print()
+        print(f"== Memory (allocated at end): {old_memory} -> {new_memory}")
+        print(compare_memory(old_memory, new_memory, top))
+        compared = True
+    if not compared:
+        print(f"[ERROR] No comparable profile results in {old} and {new}.")
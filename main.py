@@ -1,18 +1,90 @@
 import argparse
-from core import RunEverytimeAutoLike
+import importlib
 
-if __name__ == "__main__":
+# 하위 명령 정의: 이름 -> (실행할 "모듈:함수", 도움말, 인자 목록)
+# 모듈은 해당 명령을 실행할 때만 import하므로 --help나 다른 명령에서는 selenium 등을 불러오지 않음
+# 인자의 dest는 실행할 함수의 매개변수 이름과 같아야 함
+COMMANDS = {
+    "everytime": ("core.everytime.everytime_auto:RunEverytimeAutoLike", "Run Everytime auto-like", [
+        (("--headless",), {"action": "store_true", "help": "Run in headless mode"}),
+    ]),
+    "dedup": ("core.utils.file.delete_file:remove_duplicate_files", "Remove duplicate files in a folder", [
+        (("folder_path",), {"help": "Folder to scan"}),
+        (("--algorithm",), {"default": "md5", "help": "Hash algorithm (default: md5)"}),
+        (("--workers",), {"type": int, "help": "Number of hashing threads"}),
+        (("--no-cache",), {"dest": "use_cache", "action": "store_false", "help": "Do not use the hash cache"}),
+        (("--cache-path",), {"help": "Hash cache DB path"}),
+        (("--perceptual",), {"action": "store_true", "help": "Also remove visually similar images"}),
+        (("--threshold",), {"type": int, "default": 5, "help": "Perceptual hash distance threshold"}),
+        (("--perceptual-algorithm",), {"choices": ["dhash", "phash"], "default": "dhash"}),
+        (("--dry-run",), {"action": "store_true", "help": "Only write a report, do not modify files"}),
+        (("--report",), {"dest": "report_path", "help": "Report path (.csv or .json)"}),
+        (("--action",), {"choices": ["delete", "quarantine", "hardlink"], "default": "delete"}),
+        (("--quarantine-dir",), {"help": "Destination folder for --action quarantine"}),
+    ]),
+    "pdf": ("core.utils.file.save_imagefiles:PDFsave", "Save folder images as a PDF", [
+        (("image_folder",), {"help": "Image folder"}),
+        (("output_pdf",), {"nargs": "?", "default": "output.pdf", "help": "Output PDF (default: output.pdf)"}),
+        (("--incremental",), {"action": "store_true", "help": "Append only images added since the last export"}),
+        (("--recursive",), {"action": "store_true", "help": "Include images in subfolders"}),
+    ]),
+    "ppt": ("core.utils.file.save_imagefiles:PPTsave", "Save folder images as a PowerPoint deck", [
+        (("image_folder",), {"help": "Image folder"}),
+        (("output_file",), {"nargs": "?", "default": "output.pptx", "help": "Output PPTX (default: output.pptx)"}),
+        (("--no-prescale",), {"dest": "prescale", "action": "store_false", "help": "Insert original images"}),
+        (("--dpi",), {"type": int, "default": 144, "help": "Prescale resolution (default: 144)"}),
+        (("--quality",), {"type": int, "default": 85, "help": "Prescale JPEG quality (default: 85)"}),
+        (("--workers",), {"type": int, "help": "Number of prescale processes"}),
+        (("--incremental",), {"action": "store_true", "help": "Add only images added since the last export"}),
+        (("--recursive",), {"action": "store_true", "help": "Include images in subfolders"}),
+    ]),
+    "report": ("core.utils.profiling:compare_profiles", "Compare two --profile/--trace-malloc results", [
+        (("old",), {"help": "Baseline profile directory (or cpu.pstats / memory.snapshot file)"}),
+        (("new",), {"help": "Profile directory (or file) to compare"}),
+        (("--top",), {"type": int, "default": 20, "help": "Number of rows to show (default: 20)"}),
+    ]),
+}
+
+
+def load_command(name):
+    """하위 명령의 실행 함수를 import하여 반환."""
+    module_name, function_name = COMMANDS[name][0].split(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def build_parser():
     parser = argparse.ArgumentParser(description="Main Entry Point")
-    subparsers = parser.add_subparsers(dest="command", help="Sub-command to run")\
-    
-    # Everytime
-    everytime_parser = subparsers.add_parser("everytime", help="Run Everytime auto-like")
-    everytime_parser.add_argument("--headless", action="store_true", help="Run in headless mode")
+    # 전역 옵션 (하위 명령 앞에 지정): 실행 전체를 측정하여 profiles/<시각>_<명령>/에 저장
+    parser.add_argument("--profile", action="store_true", help="Profile CPU time with cProfile")
+    parser.add_argument("--trace-malloc", action="store_true", help="Trace memory allocations with tracemalloc")
+    parser.add_argument("--profile-dir", default="profiles", help="Profile output directory (default: profiles)")
+    subparsers = parser.add_subparsers(dest="command", help="Sub-command to run")
+    for name, (_, help_text, arguments) in COMMANDS.items():
+        command_parser = subparsers.add_parser(name, help=help_text)
+        for flags, options in arguments:
+            command_parser.add_argument(*flags, **options)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
 
     # 실행
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        parser.print_help()
+        return
+
+    options = vars(args)
+    command = options.pop("command")
+    profile, trace_malloc, profile_dir = options.pop("profile"), options.pop("trace_malloc"), options.pop("profile_dir")
+    if not (profile or trace_malloc):
+        return load_command(command)(**options)
+
+    from core.utils.profiling import profile_run
+    with profile_run(cpu=profile, trace_malloc=trace_malloc, label=command, root=profile_dir):
+        return load_command(command)(**options)
 
-    if args.command == "everytime":
-        RunEverytimeAutoLike(headless=args.headless)
-    else:
-        parser.print_help()
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+import os
+import pytest
+from PIL import Image
+
+pytest.importorskip("numpy")
+
+from core.utils.file import perceptual
+
+
+def _make_image(folder, name, size):
+    path = os.path.join(folder, name)
+    Image.new("RGB", size, (128, 128, 128)).save(path)
+    return path
+
+
+def test_chain_members_beyond_threshold_of_keeper_are_kept(tmp_path, monkeypatch):
+    # a(기준, 작은 해상도) - b(가장 큰 해상도), a - c는 각각 거리 2이지만 b - c는 거리 4
+    a = _make_image(tmp_path, "a.png", (10, 10))
+    b = _make_image(tmp_path, "b.png", (100, 100))
+    c = _make_image(tmp_path, "c.png", (20, 20))
+    digests = {a: "00", b: "03", c: "0c"}
+
+    monkeypatch.setattr(perceptual, "iter_files", lambda *args: [(path, os.stat(path)) for path in (a, b, c)])
+    monkeypatch.setattr(perceptual, "hash_files", lambda stats, *args, **kwargs: {path: digests[path] for path in stats})
+
+    groups = perceptual.find_similar_images(str(tmp_path), threshold=2)
+
+    assert groups == [(b, [(a, 2)])]
+